@@ -1,11 +1,11 @@
 import streamlit as st
-from difflib import get_close_matches
+from chat_history import get_history, render_history
+from command_router import CommandRouter
 
 st.title("💬 Customer Service Bot")
 
 # Initialize chat history
-if 'messages' not in st.session_state:
-    st.session_state.messages = []
+history = get_history()
 
 # Available commands and their aliases
 commands = {
@@ -17,24 +17,13 @@ commands = {
     'help': ['help', 'commands', 'options']
 }
 
+# Compile the alias lookup once per server process
+@st.cache_resource
+def load_router():
+    return CommandRouter(commands)
+
 def find_command(user_input):
-    user_input = user_input.lower().strip()
-    
-    # Check exact matches first
-    for cmd, aliases in commands.items():
-        if user_input in aliases:
-            return cmd
-    
-    # Check fuzzy matches
-    all_aliases = [alias for aliases in commands.values() for alias in aliases]
-    matches = get_close_matches(user_input, all_aliases, n=1, cutoff=0.6)
-    
-    if matches:
-        for cmd, aliases in commands.items():
-            if matches[0] in aliases:
-                return cmd
-    
-    return None
+    return load_router().route(user_input)
 
 def get_bot_response(command):
     responses = {
@@ -49,14 +38,12 @@ def get_bot_response(command):
     return responses.get(command, "I didn't understand that. Type 'help' for available commands.")
 
 # Display chat history
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.write(message["content"])
+render_history(history)
 
 # Chat input
 if prompt := st.chat_input("Type your message..."):
     # Add user message to history
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    history.append("user", prompt)
     
     # Display user message
     with st.chat_message("user"):
@@ -67,7 +54,7 @@ if prompt := st.chat_input("Type your message..."):
     bot_response = get_bot_response(command)
     
     # Add bot response to history
-    st.session_state.messages.append({"role": "assistant", "content": bot_response})
+    history.append("assistant", bot_response)
     
     # Display bot response
     with st.chat_message("assistant"):
@@ -0,0 +1,119 @@
+import sys
+import time
+import uuid
+import sqlite3
+import threading
+from collections import deque
+
+import streamlit as st
+
+
+class HistoryStore:
+    """SQLite log of chat turns shared by every session in the process
+
+    Retention is applied on write: each append drops the session's turns
+    older than its last `keep_turns`, and at most once per `expire_every`
+    seconds turns older than `keep_days` are dropped from every session,
+    which clears out sessions that were abandoned and never write again.
+    """
+
+    def __init__(self, path="chat_history.db", keep_turns=1_000, keep_days=30, expire_every=3600):
+        self.keep_turns = keep_turns
+        self.keep_seconds = keep_days * 86400
+        self.expire_every = expire_every
+        self.expired = 0.0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "session_id TEXT, seq INTEGER, role TEXT, content TEXT, created REAL, "
+            "PRIMARY KEY (session_id, seq)) WITHOUT ROWID"
+        )
+        # Databases from before retention have no timestamps; their turns count as old
+        if "created" not in [col[1] for col in self.conn.execute("PRAGMA table_info(messages)")]:
+            self.conn.execute("ALTER TABLE messages ADD COLUMN created REAL")
+
+    def append(self, session_id, seq, role, content):
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute("INSERT INTO messages VALUES (?, ?, ?, ?, ?)", (session_id, seq, role, content, now))
+            self.conn.execute("DELETE FROM messages WHERE session_id = ? AND seq <= ?", (session_id, seq - self.keep_turns))
+            if now - self.expired >= self.expire_every:
+                self.conn.execute("DELETE FROM messages WHERE COALESCE(created, 0) < ?", (now - self.keep_seconds,))
+                self.expired = now
+
+    def fetch(self, session_id, start, stop):
+        """Turns with start <= seq < stop, oldest first"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT role, content FROM messages WHERE session_id = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (session_id, start, stop),
+            ).fetchall()
+        return [{"role": role, "content": content} for role, content in rows]
+
+
+class ChatHistory:
+    """One session's chat history: the last `window` turns in memory, the rest on disk
+
+    Every turn is written through to the store, so older turns simply fall
+    out of the in-memory window and are read back only when asked for.
+    """
+
+    def __init__(self, store, window=50):
+        self.store = store
+        self.session_id = uuid.uuid4().hex
+        self.recent = deque(maxlen=window)
+        self.total = 0
+
+    def __len__(self):
+        """Turns that can still be read back; the store keeps only the last keep_turns"""
+        return min(self.total, max(self.store.keep_turns, len(self.recent)))
+
+    def append(self, role, content):
+        self.store.append(self.session_id, self.total, role, str(content))
+        self.recent.append({"role": role, "content": content})
+        self.total += 1
+
+    def last(self, count):
+        """The most recent `count` turns, reading from disk beyond the window"""
+        count = min(count, len(self))
+        in_memory = min(count, len(self.recent))
+        older = self.store.fetch(self.session_id, self.total - count, self.total - in_memory) if count > in_memory else []
+        return older + list(self.recent)[len(self.recent) - in_memory:]
+
+    def memory_bytes(self):
+        """Approximate bytes held in memory by the window"""
+        return sys.getsizeof(self.recent) + sum(
+            sys.getsizeof(m) + sys.getsizeof(m["role"]) + sys.getsizeof(m["content"]) for m in self.recent
+        )
+
+
+@st.cache_resource
+def load_history_store():
+    return HistoryStore()
+
+
+def get_history(window=50):
+    """This session's ChatHistory, created on first use"""
+    if "history" not in st.session_state:
+        st.session_state.history = ChatHistory(load_history_store(), window)
+    return st.session_state.history
+
+
+def show_older():
+    st.session_state.history_visible += st.session_state.history_page
+
+
+def render_history(history, page_size=20):
+    """Render only the visible page of turns, with a button to load older ones"""
+    st.session_state.setdefault("history_page", page_size)
+    st.session_state.setdefault("history_visible", page_size)
+    visible = st.session_state.history_visible
+    if len(history) > visible:
+        st.button(f"⬆️ Load older messages ({len(history) - visible} more)", on_click=show_older)
+    for msg in history.last(visible):
+        with st.chat_message(msg["role"]):
+            st.write(msg["content"])
+    st.sidebar.caption(f"Showing {min(visible, len(history))} of {len(history)} messages · "
+                       f"{history.memory_bytes() / 1024:.1f} KB in memory")
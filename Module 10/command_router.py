@@ -0,0 +1,217 @@
+import re
+import time
+import random
+from difflib import get_close_matches
+from itertools import combinations
+
+WORD = re.compile(r"[a-z0-9']+")
+
+
+def deletes(word, max_distance):
+    """All strings reachable from word by removing up to max_distance characters"""
+    variants = {word}
+    for d in range(1, min(max_distance, len(word)) + 1):
+        for drop in combinations(range(len(word)), d):
+            variants.add("".join(c for i, c in enumerate(word) if i not in drop))
+    return variants
+
+
+def edit_distance(a, b, limit):
+    """Edit distance between a and b counting adjacent swaps as one edit
+
+    Returns limit + 1 as soon as the distance is known to exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before, previous = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class CommandRouter:
+    """Alias -> command router compiled once from a {command: [aliases]} mapping
+
+    Exact aliases resolve through a hash lookup. Typos go through a
+    SymSpell-style deletion dictionary: every alias is stored under all of
+    its deletions, so a misspelt input only needs its own deletions looked
+    up instead of being compared with every alias. Messages that are not
+    an alias themselves ("cancel it", "tracking") are routed by their
+    words, for phrases of up to `phrase_words` words.
+    """
+
+    def __init__(self, commands, max_distance=2, phrase_words=3):
+        self.max_distance = max_distance
+        self.phrase_words = phrase_words
+        self.exact = {}
+        self.by_deletion = {}
+        for cmd, aliases in commands.items():
+            for alias in aliases:
+                alias = alias.lower().strip()
+                self.exact.setdefault(alias, cmd)
+                for variant in deletes(alias, self._allowed(alias)):
+                    self.by_deletion.setdefault(variant, set()).add(alias)
+        # Nothing longer than this is within max_distance edits of an alias
+        self.longest = max(map(len, self.exact), default=0) + max_distance
+
+    def _allowed(self, word):
+        # One typo for short words, up to max_distance for longer ones
+        return min(self.max_distance, 1 if len(word) <= 4 else 2)
+
+    def _closest(self, text):
+        """(edit distance, alias) of the nearest alias within the allowed typos, or None"""
+        if text in self.exact:
+            return 0, text
+        if len(text) > self.longest:
+            return None
+        limit = self._allowed(text)
+        best = None
+        seen = set()
+        for variant in deletes(text, limit):
+            for alias in self.by_deletion.get(variant, ()):
+                if alias in seen:
+                    continue
+                seen.add(alias)
+                distance = edit_distance(text, alias, min(limit, self._allowed(alias)))
+                if distance <= limit and (best is None or (distance, alias) < best):
+                    best = distance, alias
+        return best
+
+    def _phrase(self, text):
+        """Alias for a short phrase: the best of its words, where a word may
+        also carry an ending after an alias ("cancelled", "tracking")"""
+        words = WORD.findall(text)
+        if len(words) > self.phrase_words:
+            return None
+        best = None
+        for word in words:
+            match = self._closest(word)
+            if match is None:
+                stems = (word[:end] for end in range(min(len(word), self.longest) - 1, 2, -1))
+                match = next(((len(word) - len(stem), stem) for stem in stems if stem in self.exact), None)
+            if match is not None and (best is None or match[0] < best[0]):
+                best = match
+        return best
+
+    def route(self, user_input):
+        """Return the command for one message, or None"""
+        text = user_input.lower().strip()
+        match = self._closest(text) or self._phrase(text)
+        return self.exact[match[1]] if match else None
+
+    def classify(self, messages):
+        """Route a batch of messages, reusing results for repeated inputs"""
+        cache = {}
+        results = []
+        for msg in messages:
+            key = msg.lower().strip()
+            if key not in cache:
+                cache[key] = self.route(key)
+            results.append(cache[key])
+        return results
+
+    def classify_file(self, path, encoding="utf-8"):
+        """Route every non-empty line of a transcript file"""
+        with open(path, encoding=encoding) as f:
+            lines = [line.rstrip("\n") for line in f if line.strip()]
+        return list(zip(lines, self.classify(lines)))
+
+
+def difflib_route(commands, user_input):
+    """The original per-call matcher, kept as the benchmark baseline"""
+    user_input = user_input.lower().strip()
+    for cmd, aliases in commands.items():
+        if user_input in aliases:
+            return cmd
+    all_aliases = [alias for aliases in commands.values() for alias in aliases]
+    matches = get_close_matches(user_input, all_aliases, n=1, cutoff=0.6)
+    if matches:
+        for cmd, aliases in commands.items():
+            if matches[0] in aliases:
+                return cmd
+    return None
+
+
+def probe_messages(commands, seed=0):
+    """Messages a customer might type: aliases alone, misspelt or inflected,
+    inside short and longer phrases, plus some that name no command"""
+    rng = random.Random(seed)
+    fillers = ["it", "me", "order", "please", "now", "my order", "the delivery", "for me"]
+    probes = []
+    for aliases in commands.values():
+        for alias in aliases:
+            probes += [alias, typo(alias, rng), alias + "ed", alias + "ing", alias + "?",
+                       f"{alias} {rng.choice(fillers)}", f"please {alias}",
+                       f"can you {alias} {rng.choice(fillers)}", f"i would like to {alias} my order"]
+    return probes + ["hello", "hi there", "thanks", "ok", "yes", "no", "what?", "where is my parcel",
+                     "who are you", "good morning", "asdf", "is anyone there"]
+
+
+def calibrate(commands, messages=None, phrase_words=(0, 1, 2, 3, 4, 5)):
+    """Share of messages on which the router and difflib_route agree, per phrase_words setting"""
+    messages = probe_messages(commands) if messages is None else messages
+    expected = [difflib_route(commands, msg) for msg in messages]
+    results = []
+    for words in phrase_words:
+        router = CommandRouter(commands, phrase_words=words)
+        agree = sum(router.route(msg) == want for msg, want in zip(messages, expected))
+        results.append((words, agree / len(messages)))
+    return results
+
+
+def synthetic_commands(n_commands, aliases_per_command, seed=0):
+    """Generate a command table with random aliases for benchmarking"""
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return {
+        f"cmd{c}": ["".join(rng.choice(letters) for _ in range(rng.randint(4, 10)))
+                    for _ in range(aliases_per_command)]
+        for c in range(n_commands)
+    }
+
+
+def typo(word, rng):
+    """Swap one character for a random letter"""
+    i = rng.randrange(len(word))
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]
+
+
+def benchmark(alias_counts=(100, 1_000, 5_000), messages=2_000):
+    """Messages per second for the compiled router vs the difflib baseline"""
+    rng = random.Random(1)
+    print(f"{'aliases':>8} {'build (s)':>10} {'router msg/s':>13} {'difflib msg/s':>14}")
+    for total in alias_counts:
+        commands = synthetic_commands(total // 10, 10)
+        aliases = [a for group in commands.values() for a in group]
+        batch = [typo(rng.choice(aliases), rng) if rng.random() < 0.5 else rng.choice(aliases)
+                 for _ in range(messages)]
+
+        start = time.perf_counter()
+        router = CommandRouter(commands)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for msg in batch:
+            router.route(msg)
+        router_rate = len(batch) / (time.perf_counter() - start)
+
+        # difflib is slow with many aliases, so only time a slice
+        sample = batch[:200]
+        start = time.perf_counter()
+        for msg in sample:
+            difflib_route(commands, msg)
+        difflib_rate = len(sample) / (time.perf_counter() - start)
+
+        print(f"{total:>8} {build:>10.2f} {router_rate:>13.0f} {difflib_rate:>14.0f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,27 +1,43 @@
 import streamlit as st, re
+from chat_history import get_history, render_history
+from intent_engine import IntentEngine
+from order_store import OrderStore
 
 st.title("💬 Customer Support Chat")
 
 # Initialize session state
-st.session_state.setdefault("messages", [])
+history = get_history()
 st.session_state.setdefault("dialog_state", {"waiting_for": None, "intent": None})
 
+ORDER_ID = re.compile(r"[A-Za-z0-9]{6,10}")
+
+@st.cache_resource
+def load_intents():
+    return IntentEngine()
+
+# One order database connection per server process, seeded with demo orders on first run
+@st.cache_resource
+def load_orders():
+    store = OrderStore("orders.db")
+    if len(store) == 0:
+        store.bulk_load(1_000)
+    return store
+
 def detect_intent(msg):
-    msg = msg.lower()
-    if any(x in msg for x in ["order", "status", "track"]): return "order_status"
-    if any(x in msg for x in ["refund", "return", "money"]): return "refund_policy"
-    if any(x in msg for x in ["shipping", "delivery", "time"]): return "shipping_info"
-    return "general"
+    return load_intents().detect(msg)
 
 def valid_order_id(order_id): 
-    return bool(re.match(r"^[A-Za-z0-9]{6,10}$", order_id))
+    return bool(ORDER_ID.fullmatch(order_id))
 
 def bot_reply(user_msg):
     state = st.session_state.dialog_state
     if state["waiting_for"] == "order_id":
         if valid_order_id(user_msg):
+            order = load_orders().get(user_msg)
+            if order is None:
+                return f"❌ No order {user_msg} found. Please check the ID and try again."
             st.session_state.dialog_state = {"waiting_for": None, "intent": None}
-            return f"✅ Order {user_msg} found. Status: Shipped - Delivery tomorrow."
+            return f"✅ Order {order['order_id']} found. Status: {order['status']} - ETA {order['eta']}."
         return "❌ Invalid order ID. Please enter 6–10 alphanumeric characters."
     if state["waiting_for"] == "refund_reason":
         st.session_state.dialog_state = {"waiting_for": None, "intent": None}
@@ -39,16 +55,15 @@ def bot_reply(user_msg):
     return "I can help with order status, refunds, or shipping info. What would you like to know?"
 
 # Display chat history
-for m in st.session_state.messages:
-    with st.chat_message(m["role"]): st.write(m["content"])
+render_history(history)
 
 # Chat input
 if prompt := st.chat_input("Ask me about your order..."):
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    history.append("user", prompt)
     with st.chat_message("user"): st.write(prompt)
 
     reply = bot_reply(prompt)
-    st.session_state.messages.append({"role": "assistant", "content": reply})
+    history.append("assistant", reply)
     with st.chat_message("assistant"): st.write(reply)
 
 
@@ -1,36 +1,38 @@
 import streamlit as st
-import pandas as pd
-from difflib import get_close_matches
+from chat_history import get_history, render_history
+from faq_index import MIN_SCORE
+from faq_source import FAQSource
 
 st.title("Customer Service FAQ Bot")
 
-# Load FAQ data
-@st.cache_data
+# Load FAQ data in the background and keep it in sync with the file
+@st.cache_resource
 def load_faq():
-    return pd.read_csv("faq_data.csv")
+    return FAQSource("faq_data.csv")
 
 # Initialize chat history
-if 'messages' not in st.session_state:
-    st.session_state.messages = []
+history = get_history()
 
-faq_df = load_faq()
+faq = load_faq()
+faq.refresh()
+if faq.error:
+    st.error(f"Could not load FAQ data: {faq.error}")
+elif faq.loading:
+    st.caption(f"⏳ Updating knowledge base... {len(faq)} questions ready")
 
 def find_answer(question):
-    questions = faq_df['Question'].tolist()
-    match = get_close_matches(question.lower(), [q.lower() for q in questions], n=1, cutoff=0.4)
-    if match:
-        orig_q = questions[[q.lower() for q in questions].index(match[0])]
-        return faq_df.loc[faq_df['Question']==orig_q, 'Answer'].iloc[0], orig_q
+    matches = faq.search(question, k=1, min_score=MIN_SCORE)
+    if matches:
+        matched_q, answer, _ = matches[0]
+        return answer, matched_q
     return None, None
 
 # Display chat history
-for msg in st.session_state.messages:
-    with st.chat_message(msg["role"]):
-        st.write(msg["content"])
+render_history(history)
 
 # Chat input
 if prompt := st.chat_input("Ask me anything about our services..."):
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    history.append("user", prompt)
     with st.chat_message("user"):
         st.write(prompt)
 
@@ -42,6 +44,6 @@ if prompt := st.chat_input("Ask me anything about our services..."):
         topics = ["Order Tracking", "Returns", "Shipping", "Payment", "Account"]
         bot_msg = "I don't have a specific answer. Try these topics:\n" + "\n".join(f"• {t}" for t in topics)
     
-    st.session_state.messages.append({"role": "assistant", "content": bot_msg})
+    history.append("assistant", bot_msg)
     with st.chat_message("assistant"):
         st.write(bot_msg)
@@ -0,0 +1,196 @@
+import math
+import time
+import random
+from collections import Counter
+from difflib import get_close_matches
+
+import numpy as np
+
+NGRAM = 3
+# Posting lists shorter than this are always scanned
+SCAN_ALWAYS = 1024
+# Cosine score below which a lookup counts as no match. Cosine over n-grams is
+# lower than difflib's ratio for short or partial questions, so the old 0.4
+# cutoff does not carry over; calibrate() picks the value that best agrees
+# with difflib at 0.4 on faq_data.csv
+MIN_SCORE = 0.25
+
+
+def char_ngrams(text, n=NGRAM):
+    """Split lowercased, space-padded text into overlapping character n-grams"""
+    text = f" {' '.join(text.lower().split())} "
+    return [text[i:i + n] for i in range(max(len(text) - n + 1, 1))]
+
+
+class FAQIndex:
+    """TF-IDF index over character n-grams with an inverted posting list per n-gram"""
+
+    def __init__(self, questions):
+        self.questions = list(questions)
+        self.vocab = {}
+
+        # Map every n-gram of every question to an integer ID
+        grams = [char_ngrams(q) for q in self.questions]
+        lengths = np.fromiter(map(len, grams), dtype=np.int64, count=len(grams))
+        gram_ids = np.fromiter(
+            (self.vocab.setdefault(g, len(self.vocab)) for doc in grams for g in doc),
+            dtype=np.int64, count=int(lengths.sum()),
+        )
+        doc_ids = np.repeat(np.arange(len(grams), dtype=np.int64), lengths)
+
+        # Term frequencies per (n-gram, question), sorted by n-gram for CSR postings
+        pairs, tf = np.unique(gram_ids * max(len(grams), 1) + doc_ids, return_counts=True)
+        pair_grams, pair_docs = np.divmod(pairs, max(len(grams), 1))
+        self.df = np.bincount(pair_grams, minlength=len(self.vocab))
+        self.indptr = np.concatenate(([0], np.cumsum(self.df))).astype(np.int64)
+
+        n_docs = max(len(self.questions), 1)
+        self.idf = (np.log((1 + n_docs) / (1 + self.df)) + 1).astype(np.float32)
+        # Stored in the types np.bincount works in, so a search converts nothing
+        self.doc_ids = pair_docs.astype(np.intp)
+        self.weights = tf * self.idf[pair_grams].astype(np.float64)
+
+        # L2-normalise each question vector
+        norms = np.sqrt(np.bincount(self.doc_ids, weights=self.weights ** 2, minlength=len(self.questions)))
+        norms[norms == 0] = 1.0
+        self.weights /= norms[self.doc_ids]
+
+    def __len__(self):
+        return len(self.questions)
+
+    def search(self, query, k=5, min_score=0.0, max_df=0.2):
+        """Return up to k (row, score) pairs ranked by cosine similarity
+
+        On large indexes, n-grams found in more than `max_df` of all questions
+        ("how", "do ") barely change the ranking but own the longest posting
+        lists, so they only count towards the query norm and are not scanned.
+        """
+        counts = {}
+        for gram in char_ngrams(query):
+            gram_id = self.vocab.get(gram)
+            if gram_id is not None:
+                counts[gram_id] = counts.get(gram_id, 0) + 1
+        if not counts or not self.questions:
+            return []
+
+        gram_ids = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        q_weights = np.fromiter(counts.values(), dtype=np.float32, count=len(counts)) * self.idf[gram_ids]
+        q_weights /= np.linalg.norm(q_weights)
+        selective = self.df[gram_ids] <= max(max_df * len(self.questions), SCAN_ALWAYS)
+        if selective.any():
+            gram_ids, q_weights = gram_ids[selective], q_weights[selective]
+
+        # Gather only the postings touched by the query, one contiguous slice per n-gram
+        spans = list(zip(self.indptr[gram_ids].tolist(), self.indptr[gram_ids + 1].tolist(), q_weights.tolist()))
+        scores = np.bincount(
+            np.concatenate([self.doc_ids[start:end] for start, end, _ in spans]),
+            weights=np.concatenate([self.weights[start:end] * weight for start, end, weight in spans]),
+            minlength=len(self.questions),
+        )
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(row), float(scores[row])) for row in top if scores[row] > min_score]
+
+
+def tfidf_vector(text, df, n_docs):
+    """Unit-length n-gram vector of text, weighted as FAQIndex weights its questions
+
+    `df` maps n-grams to how many questions contain them; n-grams it does not
+    know are left out, as a search leaves out n-grams outside the vocabulary.
+    """
+    counts = Counter(gram for gram in char_ngrams(text) if df.get(gram))
+    vector = {gram: count * (math.log((1 + n_docs) / (1 + df[gram])) + 1) for gram, count in counts.items()}
+    norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+    return {gram: w / norm for gram, w in vector.items()}
+
+
+def cosine_scores(query, questions, df, n_docs):
+    """Cosine similarity of query to each question under one shared document frequency table"""
+    q = tfidf_vector(query, df, n_docs)
+    return [sum(w * q.get(gram, 0.0) for gram, w in tfidf_vector(text, df, n_docs).items()) for text in questions]
+
+
+def difflib_lookup(questions, query):
+    """The original per-call difflib matcher, kept as the benchmark baseline"""
+    lowered = [q.lower() for q in questions]
+    match = get_close_matches(query.lower(), lowered, n=1, cutoff=0.4)
+    return lowered.index(match[0]) if match else None
+
+
+def probe_queries(questions, seed=0):
+    """Queries a customer might type: exact, misspelt, partial and rephrased
+    questions, plus a few that match nothing"""
+    rng = random.Random(seed)
+
+    def typo(text):
+        i = rng.randrange(len(text))
+        return text[:i] + text[i + 1:]
+
+    probes = []
+    for q in questions:
+        words = q.rstrip("?").split()
+        probes += [q.lower(), typo(q), typo(typo(q)), " ".join(words[-2:]), " ".join(words[2:]),
+                   q.replace("my", "an").replace("your", "the"), f"where is {words[-1]}"]
+    return probes + ["hello", "thanks", "how do i", "what time is it", "can i speak to a human",
+                     "do you sell shoes", "is the store open on sunday", "refund please",
+                     "where is my package", "change my password"]
+
+
+def calibrate(questions, probes=None, thresholds=np.arange(0.05, 0.9, 0.05)):
+    """Share of probes on which index.search(min_score=t) and difflib agree, per threshold
+
+    Agreeing means both return the same question or both return nothing.
+    """
+    index = FAQIndex(questions)
+    probes = probe_queries(questions) if probes is None else probes
+    expected = [difflib_lookup(questions, p) for p in probes]
+    best = [index.search(p, k=1) or [(None, 0.0)] for p in probes]
+    results = []
+    for t in thresholds:
+        agree = sum((row if score > t else None) == want for ((row, score),), want in zip(best, expected))
+        results.append((round(float(t), 2), agree / len(probes)))
+    return results
+
+
+def synthetic_questions(n, seed=0):
+    """Generate n FAQ-style questions for benchmarking"""
+    rng = random.Random(seed)
+    verbs = ["track", "cancel", "return", "change", "update", "pay for", "ship", "reset", "find", "reorder"]
+    nouns = ["order", "refund", "password", "address", "invoice", "gift card", "subscription",
+             "parcel", "account", "coupon", "warranty", "exchange", "delivery", "payment"]
+    extras = ["online", "from abroad", "after 30 days", "on mobile", "without a receipt", "for a friend",
+              "in store", "twice", "before shipping", "with PayPal"]
+    return [f"How do I {rng.choice(verbs)} my {rng.choice(nouns)} {rng.choice(extras)} #{i}?"
+            for i in range(n)]
+
+
+def benchmark(sizes=(1_000, 10_000, 100_000), queries=20):
+    """Compare difflib against the n-gram index per lookup"""
+    print(f"{'questions':>10} {'build (s)':>10} {'index (ms)':>11} {'difflib (ms)':>13}")
+    for size in sizes:
+        questions = synthetic_questions(size)
+        probes = [q.lower().replace("my", "the") for q in random.Random(1).sample(questions, queries)]
+
+        start = time.perf_counter()
+        index = FAQIndex(questions)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for probe in probes:
+            index.search(probe, k=5)
+        index_ms = (time.perf_counter() - start) * 1000 / len(probes)
+
+        # difflib is slow at scale, so only time a few probes
+        few = probes[:max(1, queries // 10)]
+        start = time.perf_counter()
+        for probe in few:
+            difflib_lookup(questions, probe)
+        difflib_ms = (time.perf_counter() - start) * 1000 / len(few)
+
+        print(f"{size:>10} {build:>10.2f} {index_ms:>11.3f} {difflib_ms:>13.1f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,181 @@
+import os
+import hashlib
+import threading
+
+import pandas as pd
+
+from faq_index import FAQIndex, char_ngrams, cosine_scores
+
+
+def read_chunks(path, chunksize):
+    """Yield Question/Answer frames from a CSV or Parquet file, chunksize rows at a time"""
+    if path.endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=["Question", "Answer"]):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=["Question", "Answer"], dtype=str)
+
+
+def file_digest(path, block=1 << 20):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        while chunk := f.read(block):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FAQSource:
+    """A FAQ file kept in sync with its search index while the app runs
+
+    The file is read in chunks on a background thread, and every chunk
+    becomes its own index segment, so questions are searchable before the
+    whole file has loaded. refresh() is cheap enough to call on every rerun:
+    it only stats the file, and on a real content change it diffs the rows.
+    Changed answers are swapped in place, removed questions are tombstoned,
+    and only new questions are indexed, in a new segment. Segments are
+    merged back into one when the load finishes or when dead rows pile up.
+    """
+
+    def __init__(self, path, chunksize=50_000, compact_ratio=0.25):
+        self.path = path
+        self.chunksize = chunksize
+        self.compact_ratio = compact_ratio
+        self.lock = threading.Lock()
+        self.answers = {}      # question -> answer
+        self.live = {}         # question -> (segment, row) currently allowed to match
+        self.segments = []     # [FAQIndex, ...]
+        self.dead = 0
+        self.signature = None
+        self.digest = None
+        self.worker = None
+        self.error = None
+        self._start(self._initial_load)
+
+    @property
+    def loading(self):
+        return self.worker is not None and self.worker.is_alive()
+
+    def __len__(self):
+        return len(self.live)
+
+    def _start(self, target):
+        self.worker = threading.Thread(target=self._guard, args=(target,), daemon=True)
+        self.worker.start()
+
+    def _guard(self, target):
+        try:
+            target()
+        except Exception as exc:  # surfaced to the UI instead of dying silently
+            self.error = exc
+        else:
+            self.error = None
+
+    def _stat(self):
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    def _add_segment(self, questions):
+        if not questions:
+            return
+        index = FAQIndex(questions)
+        with self.lock:
+            seg = len(self.segments)
+            self.segments.append(index)
+            for row, q in enumerate(questions):
+                self.live[q] = (seg, row)
+
+    def _initial_load(self):
+        self.signature = self._stat()
+        for chunk in read_chunks(self.path, self.chunksize):
+            chunk = chunk.dropna(subset=["Question"]).fillna("")
+            fresh = []
+            with self.lock:
+                for q, a in zip(chunk["Question"], chunk["Answer"]):
+                    if q not in self.answers:
+                        fresh.append(q)
+                    self.answers[q] = a
+            self._add_segment(fresh)
+        self.digest = file_digest(self.path)
+        self._compact()
+
+    def _reload(self):
+        signature = self._stat()
+        digest = file_digest(self.path)
+        if digest == self.digest:
+            self.signature = signature
+            return
+
+        latest = {}
+        for chunk in read_chunks(self.path, self.chunksize):
+            chunk = chunk.dropna(subset=["Question"]).fillna("")
+            latest.update(zip(chunk["Question"], chunk["Answer"]))
+
+        with self.lock:
+            removed = [q for q in self.answers if q not in latest]
+            for q in removed:
+                del self.answers[q]
+                del self.live[q]
+            self.dead += len(removed)
+            fresh = [q for q in latest if q not in self.answers]
+            self.answers.update(latest)
+        self._add_segment(fresh)
+        self.signature, self.digest = signature, digest
+
+        if self.dead > self.compact_ratio * max(len(self.live), 1) or len(self.segments) > 8:
+            self._compact()
+
+    def _compact(self):
+        """Rebuild a single segment from the live questions
+
+        Only the worker thread writes, so nothing changes underneath the
+        rebuild; searches keep using the old segments until the swap.
+        """
+        if len(self.segments) <= 1 and not self.dead:
+            return
+        questions = list(self.live)
+        index = FAQIndex(questions)
+        with self.lock:
+            self.segments = [index]
+            self.live = {q: (0, row) for row, q in enumerate(questions)}
+            self.dead = 0
+
+    def refresh(self):
+        """Pick up edits to the source file; returns True when a reload was started"""
+        if self.loading:
+            return False
+        try:
+            if self._stat() == self.signature:
+                return False
+        except FileNotFoundError:
+            return False
+        self._start(self._reload)
+        return True
+
+    def search(self, query, k=5, min_score=0.0):
+        """Top k (question, answer, score) matches across all live segments
+
+        Each segment weights n-grams by its own IDF, so while there is more
+        than one, their scores do not compare: each segment's best live
+        questions are re-scored together, with document frequencies summed
+        over all segments, before the threshold and the final cut.
+        """
+        with self.lock:
+            segments = list(self.segments)
+            live, answers, dead = self.live, self.answers, self.dead
+        threshold = min_score if len(segments) == 1 else 0.0
+        hits = []
+        for seg, index in enumerate(segments):
+            matches = [(score, index.questions[row]) for row, score in index.search(query, k=k + dead, min_score=threshold)
+                       if live.get(index.questions[row]) == (seg, row)]
+            hits += matches[:k]
+        if len(segments) > 1 and hits:
+            candidates = [q for _, q in hits]
+            grams = set(char_ngrams(query)).union(*map(char_ngrams, candidates))
+            df = {gram: sum(int(index.df[index.vocab[gram]]) for index in segments if gram in index.vocab)
+                  for gram in grams}
+            scores = cosine_scores(query, candidates, df, sum(map(len, segments)))
+            hits = [(score, q) for score, q in zip(scores, candidates) if score > min_score]
+        hits.sort(reverse=True)
+        return [(q, answers.get(q, ""), score) for score, q in hits[:k]]
@@ -0,0 +1,126 @@
+import sqlite3
+import threading
+import time
+import random
+import os
+from datetime import date, timedelta
+from functools import lru_cache
+
+STATUSES = ["Processing", "Shipped", "Out for delivery", "Delivered"]
+
+
+def order_id(n):
+    """Synthetic order IDs that pass the chat's 6-10 alphanumeric check"""
+    return f"ORD{n:07d}"
+
+
+class OrderStore:
+    """SQLite-backed order lookups with one shared connection and an LRU of hot IDs
+
+    Streamlit serves every session from its own thread, so the connection is
+    opened with check_same_thread=False and guarded by a lock. Keep one store
+    per process (e.g. in st.cache_resource) rather than one per session.
+    Other processes may write the same database, so a cached order is read
+    again once it is up to `ttl` seconds old.
+    """
+
+    def __init__(self, path="orders.db", cache_size=10_000, ttl=30.0):
+        self.path = path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS orders ("
+            "order_id TEXT PRIMARY KEY, status TEXT NOT NULL, eta TEXT) WITHOUT ROWID"
+        )
+        self.lookup = lru_cache(maxsize=cache_size)(self._fetch)
+
+    def _fetch(self, oid, period=None):
+        # `period` only keys the cache: a new one starts every ttl seconds
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status, eta FROM orders WHERE order_id = ?", (oid,)
+            ).fetchone()
+        if row is None:
+            # Raised rather than returned: lru_cache does not cache exceptions, so an
+            # order that does not exist yet is found as soon as it is written
+            raise KeyError(oid)
+        return {"order_id": oid, "status": row[0], "eta": row[1]}
+
+    def get(self, oid):
+        """Order dict for an ID, or None when it does not exist"""
+        try:
+            return self.lookup(oid.upper(), int(time.monotonic() // self.ttl))
+        except KeyError:
+            return None
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM orders").fetchone()[0]
+
+    def upsert(self, orders):
+        """Insert or replace (order_id, status, eta) rows and drop them from the cache"""
+        orders = list(orders)
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO orders VALUES (?, ?, ?)", orders)
+        self.lookup.cache_clear()
+
+    def bulk_load(self, n, start=0, batch_size=100_000, seed=0):
+        """Append n synthetic orders in large transactions"""
+        rng = random.Random(seed)
+        today = date.today()
+        with self.lock:
+            self.conn.execute("PRAGMA synchronous=OFF")
+            for offset in range(start, start + n, batch_size):
+                rows = [
+                    (order_id(i), rng.choice(STATUSES), (today + timedelta(days=rng.randint(0, 7))).isoformat())
+                    for i in range(offset, min(offset + batch_size, start + n))
+                ]
+                with self.conn:
+                    self.conn.executemany("INSERT OR REPLACE INTO orders VALUES (?, ?, ?)", rows)
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lookup.cache_clear()
+
+    def close(self):
+        self.conn.close()
+
+
+def benchmark(sizes=(10_000, 1_000_000, 10_000_000), lookups=20_000, path="orders_bench.db"):
+    """Lookup latency as the table grows, cold (SQLite) and hot (LRU)"""
+    if os.path.exists(path):
+        os.remove(path)
+    store = OrderStore(path, cache_size=1_000)
+    rng = random.Random(1)
+    loaded = 0
+    print(f"{'orders':>11} {'load (s)':>9} {'cold (us)':>10} {'hot (us)':>9}")
+    for size in sizes:
+        start = time.perf_counter()
+        store.bulk_load(size - loaded, start=loaded)
+        load = time.perf_counter() - start
+        loaded = size
+
+        ids = [order_id(rng.randrange(size)) for _ in range(lookups)]
+        store.lookup.cache_clear()
+        start = time.perf_counter()
+        for oid in ids:
+            store._fetch(oid)
+        cold = (time.perf_counter() - start) * 1e6 / lookups
+
+        hot_ids = ids[:500]
+        for oid in hot_ids:
+            store.get(oid)
+        start = time.perf_counter()
+        for i in range(lookups):
+            store.get(hot_ids[i % len(hot_ids)])
+        hot = (time.perf_counter() - start) * 1e6 / lookups
+
+        print(f"{size:>11} {load:>9.1f} {cold:>10.1f} {hot:>9.2f}")
+    store.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    benchmark()
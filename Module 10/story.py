@@ -1,75 +1,73 @@
 import streamlit as st
-import time
+from chat_history import get_history, render_history
+from story_stream import Pacing, StreamScheduler
+from story_model import train_models
 
 st.title("📖 Storyteller Bot")
 
 # Initialize chat history
-if 'messages' not in st.session_state:
-    st.session_state.messages = []
+history = get_history()
 if 'story_generated' not in st.session_state:
     st.session_state.story_generated = False
 
+# One pacing thread shared by every session on this server
+@st.cache_resource
+def load_scheduler():
+    return StreamScheduler()
+
+words_per_second = st.sidebar.slider("Words per second", 2, 40, 12)
+
+# Train one Markov model per theme from the stories/ folder, once per server process
+@st.cache_resource
+def load_models():
+    return train_models("stories")
+
+models = load_models()
+if not models:
+    st.error("No stories to learn from: add <theme>.txt files or <theme>/ folders of .txt files to stories/.")
+    st.stop()
+story_words = st.sidebar.slider("Story length (words)", 50, 500, 150, step=50)
+with st.sidebar.expander("Model stats"):
+    for name, model in models.items():
+        st.write(f"**{name}**: {len(model.vocab)} words, "
+                 f"{model.nbytes / 1024:.0f} KB, built in {model.build_seconds * 1000:.1f} ms")
+
 def generate_story(theme):
-    """Generator function that yields story content with delays"""
-    
-    stories = {
-        'space adventure': [
-            "Captain Maya adjusted her helmet as the spaceship approached the mysterious planet.",
-            "The surface was covered in crystalline structures that pulsed with an eerie blue light.",
-            "As she stepped out of the airlock, the ground beneath her feet hummed with energy.",
-            "Suddenly, one of the crystals began to glow brighter, revealing an ancient message."
-        ],
-        'mystery': [
-            "Detective Chen examined the locked room where the victim was found.",
-            "There were no signs of forced entry, yet the window was open to the rain.",
-            "On the desk lay a half-finished letter with just two words: 'Trust nobody.'",
-            "As thunder rolled overhead, Chen noticed something strange about the bookshelf."
-        ],
-        'fantasy': [
-            "The old wizard's tower stood crooked against the stormy sky.",
-            "Elara clutched her staff tighter as she climbed the winding stone steps.",
-            "Each door she passed was marked with glowing runes that whispered secrets.",
-            "At the top, she found not a wizard, but a dragon reading an ancient book."
-        ],
-        'magical animals': [
-            "In the heart of the Enchanted Forest, a shimmering unicorn named Luna appeared.",
-            "Her mane sparkled with the colors of the rainbow, and she spoke in a gentle, musical voice.",
-            "Luna invited the young adventurer to follow her to a hidden glade filled with talking animals.",
-            "Together, they solved riddles, discovered magical treasures, and made friends that would last a lifetime."
-        ]
-    }
-    
-    story_parts = stories.get(theme.lower(), [
-        "Once upon a time, in a place far from here, something unusual happened.",
-        "The main character faced a challenge they had never encountered before.",
-        "With determination and courage, they began their journey.",
-        "And that's how their greatest adventure began."
-    ])
-    
-    for part in story_parts:
-        yield part + "\n\n"
-        time.sleep(3) 
+    """Stream story content word by word without sleeping in the script thread"""
+    theme = theme.lower()
+    model = next((m for name, m in models.items() if name in theme), models["any"])
+    story_parts = model.sample(story_words)
+
+    return load_scheduler().stream(
+        [part + "\n\n" for part in story_parts],
+        Pacing(words_per_second=words_per_second),
+    )
 
 # Display chat history
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.write(message["content"])
+render_history(history)
 
 # Chat input
 if prompt := st.chat_input("What kind of story would you like? (space adventure, mystery, fantasy)"):
-    st.session_state.messages.append({"role": "user", "content": prompt})
+    history.append("user", prompt)
     
     with st.chat_message("user"):
         st.write(prompt)
   
     bot_response = f"Let me tell you a {prompt} story..."
  
-    st.session_state.messages.append({"role": "assistant", "content": bot_response})
+    history.append("assistant", bot_response)
    
     with st.chat_message("assistant"):
         st.write(bot_response)
    
     with st.chat_message("assistant"):
-        story_content = st.write_stream(generate_story(prompt))
+        story = generate_story(prompt)
+        story_content = st.write_stream(story)
+        metrics = story.metrics
+        if metrics['timed_out']:
+            st.warning("The story stopped arriving, so it ends here.")
+        if metrics['time_to_first_chunk'] is not None:
+            st.caption(f"First word after {metrics['time_to_first_chunk'] * 1000:.0f} ms · "
+                       f"{metrics['chunks_per_second']:.1f} chunks/s")
  
-    st.session_state.messages.append({"role": "assistant", "content": story_content})
\ No newline at end of file
+    history.append("assistant", story_content)
\ No newline at end of file
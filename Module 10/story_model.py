@@ -0,0 +1,139 @@
+import re
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+import numpy as np
+
+WORD = re.compile(r"\S+")
+SENTENCE_END = (".", "!", "?")
+
+
+class MarkovModel:
+    """Second-order word Markov chain stored as sorted NumPy arrays
+
+    Words are mapped to int32 IDs. Every (previous, current) word pair is
+    packed into one int64 context key. The keys are sorted, and each one
+    points at a slice of next-word IDs with a cumulative probability table,
+    so sampling a word is two binary searches with no Python dicts involved.
+    """
+
+    def __init__(self, text):
+        start = time.perf_counter()
+        words = WORD.findall(text)
+        if len(words) < 3:
+            raise ValueError("Need at least three words to train a story model")
+
+        self.vocab, ids = np.unique(np.array(words, dtype=object), return_inverse=True)
+        ids = ids.astype(np.int64)
+        size = len(self.vocab)
+
+        # Count every (context, next word) transition in one sort
+        contexts = ids[:-2] * size + ids[1:-1]
+        transitions, counts = np.unique(contexts * size + ids[2:], return_counts=True)
+        keys, self.next_ids = np.divmod(transitions, size)
+        self.next_ids = self.next_ids.astype(np.int32)
+
+        self.contexts, self.offsets = np.unique(keys, return_index=True)
+        self.offsets = np.append(self.offsets, len(keys)).astype(np.int64)
+        totals = np.add.reduceat(counts, self.offsets[:-1])
+        running = np.cumsum(counts) - np.repeat(np.cumsum(totals) - totals, np.diff(self.offsets))
+        self.cumprob = (running / np.repeat(totals, np.diff(self.offsets))).astype(np.float32)
+
+        # Contexts that open a sentence are where stories may start
+        ends_sentence = np.array([w.endswith(SENTENCE_END) for w in self.vocab])
+        first = np.flatnonzero(ends_sentence[ids[:-1]]) + 1
+        first = first[first < len(ids) - 1]
+        starts = ids[first] * size + ids[first + 1]
+        self.starts = np.unique(np.append(starts, contexts[0]))
+        self.ends_sentence = ends_sentence
+        self.build_seconds = time.perf_counter() - start
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the model, vocabulary strings included"""
+        arrays = (self.next_ids, self.contexts, self.offsets, self.cumprob, self.starts, self.ends_sentence)
+        return sum(a.nbytes for a in arrays) + sum(len(w) + 49 for w in self.vocab)
+
+    def sample(self, words=200, seed=None, paragraph_sentences=4):
+        """Generate about `words` words, split into paragraphs"""
+        rng = np.random.default_rng(seed)
+        size = len(self.vocab)
+        draws = rng.random(words + 2).tolist()
+        context = int(self.starts[rng.integers(len(self.starts))])
+        out = [int(context // size), int(context % size)]
+        while len(out) < words:
+            row = int(self.contexts.searchsorted(context))
+            if row == len(self.contexts) or self.contexts[row] != context:
+                # Dead end (last words of the corpus): restart at a sentence opening
+                context = int(self.starts[rng.integers(len(self.starts))])
+                out.extend((int(context // size), int(context % size)))
+                continue
+            lo, hi = int(self.offsets[row]), int(self.offsets[row + 1])
+            pick = min(bisect_left(self.cumprob, draws[len(out)], lo, hi), hi - 1)
+            nxt = int(self.next_ids[pick])
+            out.append(nxt)
+            context = (context % size) * size + nxt
+
+        # Finish on a full sentence if one ends reasonably close to the limit
+        ends = [i for i, w in enumerate(out) if self.ends_sentence[w]]
+        if ends and ends[-1] >= words // 2:
+            out = out[:ends[-1] + 1]
+
+        paragraphs, current, sentences = [], [], 0
+        for w in out:
+            current.append(self.vocab[w])
+            if self.ends_sentence[w]:
+                sentences += 1
+                if sentences % paragraph_sentences == 0:
+                    paragraphs.append(" ".join(current))
+                    current = []
+        if current:
+            paragraphs.append(" ".join(current))
+        return paragraphs
+
+
+def load_corpus(directory):
+    """Read {theme: text} from <directory>/<theme>.txt files and <directory>/<theme>/*.txt folders"""
+    corpus = {}
+    for path in sorted(Path(directory).iterdir()):
+        if path.is_dir():
+            text = "\n".join(p.read_text(encoding="utf-8") for p in sorted(path.glob("*.txt")))
+        elif path.suffix == ".txt":
+            text = path.read_text(encoding="utf-8")
+        else:
+            continue
+        if text.strip():
+            corpus[path.stem.lower()] = corpus.get(path.stem.lower(), "") + "\n" + text
+    return corpus
+
+
+def train_models(directory):
+    """One model per theme plus an 'any' model trained on the whole corpus
+
+    Returns an empty dict, with no 'any' model, when no story has any text.
+    """
+    corpus = load_corpus(directory)
+    models = {theme: MarkovModel(text) for theme, text in corpus.items()}
+    if corpus:
+        models["any"] = MarkovModel("\n".join(corpus.values()))
+    return models
+
+
+def benchmark(words=500, samples=50, corpus_words=(10_000, 100_000, 1_000_000)):
+    """Build time, memory and sampling time on synthetic corpora"""
+    rng = np.random.default_rng(0)
+    lexicon = np.array([f"w{i}" for i in range(5_000)] + [f"end{i}." for i in range(500)], dtype=object)
+    print(f"{'corpus words':>13} {'build (s)':>10} {'memory (MB)':>12} {'sample (ms)':>12}")
+    for n in corpus_words:
+        text = " ".join(lexicon[rng.zipf(1.3, n) % len(lexicon)])
+        model = MarkovModel(text)
+        start = time.perf_counter()
+        for i in range(samples):
+            model.sample(words, seed=i)
+        sample_ms = (time.perf_counter() - start) * 1000 / samples
+        print(f"{n:>13} {model.build_seconds:>10.2f} {model.nbytes / 1e6:>12.1f} {sample_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,196 @@
+import re
+import time
+import queue
+import heapq
+import random
+import threading
+import itertools
+
+TOKEN = re.compile(r"\S+\s*|\s+")
+_DONE = object()
+
+
+class Pacing:
+    """How fast chunks are released: a words-per-second rate, jitter and pauses
+
+    Delays are in seconds. Sentence and paragraph ends get an extra pause so
+    the stream reads naturally instead of at a flat ticker rate.
+    """
+
+    def __init__(self, words_per_second=12.0, jitter=0.3, sentence_pause=0.25, paragraph_pause=0.6, seed=None):
+        self.words_per_second = words_per_second
+        self.jitter = jitter
+        self.sentence_pause = sentence_pause
+        self.paragraph_pause = paragraph_pause
+        self.rng = random.Random(seed)
+
+    def delay(self, chunk):
+        base = 1.0 / self.words_per_second if self.words_per_second > 0 else 0.0
+        delay = base * (1 + self.rng.uniform(-self.jitter, self.jitter))
+        if "\n\n" in chunk:
+            delay += self.paragraph_pause
+        elif chunk.rstrip().endswith((".", "!", "?")):
+            delay += self.sentence_pause
+        return max(delay, 0.0)
+
+
+def tokenize(parts):
+    """Split text parts into word-sized chunks that keep their trailing whitespace"""
+    for part in parts:
+        yield from TOKEN.findall(part)
+
+
+class StoryStream:
+    """One paced stream; chunks arrive through a bounded queue
+
+    The stream ends early, with `timed_out` set, if no chunk arrives within
+    `timeout` seconds, so a stalled or dropped producer never hangs the reader.
+    """
+
+    def __init__(self, chunks, pacing, maxsize, timeout=30.0):
+        self.chunks = iter(chunks)
+        self.pacing = pacing
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.timeout = timeout
+        self.timed_out = False
+        self.pending = None
+        self.started = time.perf_counter()
+        self.first_chunk = None
+        self.finished = None
+        self.closed = False
+        self.stalled_since = None
+        self.count = 0
+
+    def __iter__(self):
+        """Yield chunks as the scheduler releases them (use with st.write_stream)"""
+        try:
+            while True:
+                try:
+                    chunk = self.queue.get(timeout=self.timeout)
+                except queue.Empty:
+                    self.timed_out = True
+                    chunk = _DONE
+                if chunk is _DONE:
+                    self.finished = time.perf_counter()
+                    return
+                if self.first_chunk is None:
+                    self.first_chunk = time.perf_counter()
+                self.count += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+    @property
+    def metrics(self):
+        """Time to first chunk and chunk rate, in seconds and chunks per second"""
+        end = self.finished or time.perf_counter()
+        ttfc = (self.first_chunk - self.started) if self.first_chunk else None
+        streaming = end - (self.first_chunk or self.started)
+        return {
+            "time_to_first_chunk": ttfc,
+            "chunks": self.count,
+            "chunks_per_second": self.count / streaming if streaming > 0 else 0.0,
+            "timed_out": self.timed_out,
+        }
+
+
+class StreamScheduler:
+    """Paces every active story from a single background thread
+
+    Producers never sleep inside a session's script thread. Each stream
+    sits in a heap keyed by when its next chunk is due, and one daemon
+    thread releases chunks into the streams' bounded queues. A full queue
+    means its reader has fallen behind, so that stream is retried shortly
+    instead of blocking the others, and dropped once it has been stuck for
+    `abandon_after` seconds (e.g. the browser tab was closed).
+    """
+
+    def __init__(self, queue_size=64, retry=0.02, abandon_after=30.0):
+        self.queue_size = queue_size
+        self.retry = retry
+        self.abandon_after = abandon_after
+        self.heap = []
+        self.seq = itertools.count()
+        self.wakeup = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="story-scheduler", daemon=True)
+        self.thread.start()
+
+    def stream(self, parts, pacing=None):
+        """Start streaming text parts; returns an iterable StoryStream"""
+        story = StoryStream(tokenize(parts), pacing or Pacing(), self.queue_size, self.abandon_after)
+        self._schedule(story, time.monotonic())
+        return story
+
+    def active(self):
+        with self.wakeup:
+            return len(self.heap)
+
+    def _schedule(self, story, due):
+        with self.wakeup:
+            heapq.heappush(self.heap, (due, next(self.seq), story))
+            self.wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self.wakeup:
+                while not self.heap:
+                    self.wakeup.wait()
+                due, _, story = self.heap[0]
+                now = time.monotonic()
+                if due > now:
+                    self.wakeup.wait(due - now)
+                    continue
+                heapq.heappop(self.heap)
+            self._release(story, now)
+
+    def _release(self, story, now):
+        if story.closed:
+            return
+        if story.pending is None:
+            story.pending = next(story.chunks, _DONE)
+        try:
+            story.queue.put_nowait(story.pending)
+        except queue.Full:
+            story.stalled_since = story.stalled_since or now
+            if now - story.stalled_since < self.abandon_after:
+                self._schedule(story, now + self.retry)
+            return
+        story.stalled_since = None
+        if story.pending is not _DONE:
+            delay = story.pacing.delay(story.pending)
+            story.pending = None
+            self._schedule(story, now + delay)
+
+
+def benchmark(readers=200, words=120, words_per_second=40.0):
+    """Run many concurrent readers and report latency and thread usage"""
+    scheduler = StreamScheduler()
+    text = [" ".join(["word"] * 20) + ".\n\n"] * (words // 20)
+    results = []
+
+    def read():
+        story = scheduler.stream(text, Pacing(words_per_second, jitter=0, sentence_pause=0, paragraph_pause=0))
+        for _ in story:
+            pass
+        results.append(story.metrics)
+
+    threads_before = threading.active_count()
+    start = time.perf_counter()
+    workers = [threading.Thread(target=read) for _ in range(readers)]
+    for w in workers:
+        w.start()
+    peak_threads = threading.active_count() - threads_before - readers
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+
+    ttfc = sorted(r["time_to_first_chunk"] for r in results if r["time_to_first_chunk"] is not None)
+    rate = sum(r["chunks_per_second"] for r in results) / len(results)
+    print(f"{readers} readers x {words} words in {elapsed:.1f}s")
+    print(f"time to first chunk: p50 {ttfc[len(ttfc) // 2] * 1000:.1f} ms, max {ttfc[-1] * 1000:.1f} ms")
+    print(f"mean chunks/s per reader: {rate:.1f} (target {words_per_second:.0f})")
+    print(f"producer threads beyond the shared scheduler: {peak_threads}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from downsample import METHODS, arrow_payload, describe, downsample, minute_series, point_budget, savings
 
 st.title("Fitness Progress Dashboard")
 
@@ -26,6 +27,26 @@ st.area_chart(df.set_index('Date')['Calories'])
 st.subheader("Weekly Workout Sessions")
 st.bar_chart(df.set_index('Date')['Workouts'])
 
+# Minute-level heart rate for the past year, reduced server-side to the chart width
+@st.cache_data
+def heart_rate():
+    return minute_series(days=365).rename(columns={'Value': 'Heart Rate'})
+
+@st.cache_data(max_entries=32)
+def heart_rate_points(budget, method):
+    """Downsampled once per resolution; only these points reach the browser"""
+    full = heart_rate()
+    points = downsample(full, 'Time', 'Heart Rate', budget, method)
+    return points, savings(full.set_index('Time'), points.set_index('Time'), arrow_payload)
+
+st.subheader("Heart Rate (minute by minute, past year)")
+col1, col2 = st.columns(2)
+width = col1.slider("Chart width (px)", 200, 2000, 800, step=100)
+method = col2.radio("Downsampling", METHODS, horizontal=True)
+points, stats = heart_rate_points(point_budget(width, method), method)
+st.line_chart(points.set_index('Time')['Heart Rate'])
+st.caption(describe(stats))
+
 # Sleep vs Calories scatter plot
 st.subheader("Sleep vs Calories Relationship")
 scatter_data = df[['Sleep', 'Calories']].rename(columns={'Sleep': 'x', 'Calories': 'y'})
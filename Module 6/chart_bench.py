@@ -0,0 +1,234 @@
+import csv
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.logger import set_log_level
+
+from downsample import METHODS, downsample, minute_series, point_budget
+from figure_cache import RenderCache
+
+BACKENDS = ["streamlit", "matplotlib", "plotly"]
+KINDS = ["line", "area", "bar"]
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+FIELDS = ["backend", "kind", "points", "sent", "status", "build_s", "payload_bytes", "peak_mb", "over_message_limit"]
+
+
+def series(points, seed=7):
+    """`points` minutes of the same signal the heart-rate chart shows"""
+    return minute_series(days=-(-points // 1440), seed=seed).iloc[:points]
+
+
+@contextmanager
+def sent_elements():
+    """Sizes of the element protos Streamlit builds while the block runs
+
+    Works in bare mode (no server): the chart is marshalled exactly as in
+    a running app, which is what reaches the browser, and then dropped.
+    """
+    sizes = []
+    enqueue = DeltaGenerator._enqueue
+
+    def record(self, delta_type, element_proto, *args, **kwargs):
+        sizes.append(element_proto.ByteSize())
+        return enqueue(self, delta_type, element_proto, *args, **kwargs)
+
+    DeltaGenerator._enqueue = record
+    try:
+        yield sizes
+    finally:
+        DeltaGenerator._enqueue = enqueue
+
+
+def streamlit_chart(kind, df):
+    with sent_elements() as sizes:
+        getattr(st, f"{kind}_chart")(df.set_index('Time')['Value'])
+    return sum(sizes)
+
+
+def plotly_chart(kind, df):
+    import plotly.express as px
+
+    with sent_elements() as sizes:
+        st.plotly_chart(getattr(px, kind)(df, x='Time', y='Value'))
+    return sum(sizes)
+
+
+def matplotlib_chart(kind, df):
+    """PNG bytes as show_chart() sends them, from a fresh cache so every call renders"""
+    x, y = df['Time'].to_numpy(), df['Value'].to_numpy()
+
+    def draw(fig, ax):
+        if kind == "line":
+            ax.plot(x, y)
+        elif kind == "area":
+            ax.fill_between(x, y)
+        else:
+            ax.bar(x, y, width=np.timedelta64(1, 'm'))
+
+    return len(RenderCache().render(kind, draw))
+
+
+RENDERERS = {"streamlit": streamlit_chart, "matplotlib": matplotlib_chart, "plotly": plotly_chart}
+
+
+def measure(backend, kind, df, repeat=3):
+    """Build time, payload bytes and peak traced memory for one chart
+
+    Build time is the best of up to `repeat` untraced calls (fewer once a
+    second has been spent); peak memory comes from one more call under
+    tracemalloc, which slows Python down too much to time the same run.
+    """
+    timings = []
+    while len(timings) < repeat and sum(timings) < 1.0:
+        start = time.perf_counter()
+        payload = RENDERERS[backend](kind, df)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        RENDERERS[backend](kind, df)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return min(timings), payload, peak
+
+
+def run(sizes=SIZES, backends=BACKENDS, kinds=KINDS, method=None, width_px=800, max_seconds=30.0, log=print):
+    """One record per (backend, kind, size)
+
+    With `method`, each series is first downsampled to the chart width, as
+    the dashboards do, and `sent` is the number of points left. Build time
+    is assumed to grow at least linearly with the points sent, so a size
+    expected to take longer than `max_seconds` is recorded as skipped
+    rather than run.
+    """
+    limit = st.get_option("server.maxMessageSize") * 1e6
+    frames = {n: series(n) for n in sorted(sizes)}
+    if method:
+        frames = {n: downsample(df, 'Time', 'Value', point_budget(width_px, method), method) for n, df in frames.items()}
+    results = []
+    for backend in backends:
+        for kind in kinds:
+            # Untimed first call, so imports and one-off setup are not charged to the smallest size
+            RENDERERS[backend](kind, series(100))
+            last = None
+            for n, df in frames.items():
+                row = dict.fromkeys(FIELDS)
+                row.update(backend=backend, kind=kind, points=n, sent=len(df))
+                estimate = last and last['build_s'] * len(df) / last['sent']
+                if estimate and estimate > max_seconds:
+                    row['status'] = f"skipped: about {estimate:.0f}s expected"
+                else:
+                    try:
+                        build_s, payload, peak = measure(backend, kind, df)
+                    except MemoryError:
+                        row['status'] = "out of memory"
+                    else:
+                        row.update(status="ok", build_s=round(build_s, 4), payload_bytes=payload,
+                                   peak_mb=round(peak / 1e6, 1), over_message_limit=payload > limit)
+                        last = row
+                log(row)
+                results.append(row)
+    return results
+
+
+def environment():
+    from importlib.metadata import version
+
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            **{name: version(name) for name in ("streamlit", "pandas", "pyarrow", "matplotlib", "plotly")}}
+
+
+def write_report(results, path, **settings):
+    """JSON (results plus settings and library versions) or, for a .csv path, one row per result"""
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, "w") as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "environment": environment(),
+                       "settings": settings, "results": results}, f, indent=1)
+
+
+def read_results(path):
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            return [{**row, "build_s": float(row["build_s"] or "nan"), "payload_bytes": int(row["payload_bytes"] or 0),
+                     "peak_mb": float(row["peak_mb"] or "nan")} for row in csv.DictReader(f)]
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline, current, tolerance=0.25, min_seconds=0.05):
+    """Measurements that grew by more than `tolerance` against a baseline report
+
+    Only charts of the same size sent are compared, and times under
+    `min_seconds` are too noisy to compare and are ignored.
+    """
+    before = {(r["backend"], r["kind"], int(r["points"]), int(r["sent"])): r for r in baseline if r["status"] == "ok"}
+    regressions = []
+    for row in current:
+        old = before.get((row["backend"], row["kind"], row["points"], row["sent"]))
+        if row["status"] != "ok" or old is None:
+            continue
+        for field in ("build_s", "payload_bytes", "peak_mb"):
+            if field == "build_s" and max(old[field], row[field]) < min_seconds:
+                continue
+            if row[field] > old[field] * (1 + tolerance):
+                regressions.append({"backend": row["backend"], "kind": row["kind"], "points": row["points"],
+                                    "field": field, "baseline": old[field], "current": row[field]})
+    return regressions
+
+
+def print_row(row):
+    if row["status"] != "ok":
+        print(f"{row['backend']:<11} {row['kind']:<5} {row['points']:>11,} {row['status']}")
+        return
+    print(f"{row['backend']:<11} {row['kind']:<5} {row['points']:>11,} {row['sent']:>11,} {row['build_s']:>9.3f} "
+          f"{row['payload_bytes'] / 1e6:>12.2f} {row['peak_mb']:>9.1f}" + ("  over message limit" if row["over_message_limit"] else ""))
+
+
+def benchmark(argv=None):
+    """Render the same line, area and bar charts with each backend and write a report"""
+    parser = argparse.ArgumentParser(description=benchmark.__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=KINDS)
+    parser.add_argument("--downsample", choices=METHODS, help="reduce each series to the chart width first")
+    parser.add_argument("--width", type=int, default=800, help="chart width in pixels for --downsample")
+    parser.add_argument("--max-seconds", type=float, default=30.0, help="skip charts expected to take longer")
+    parser.add_argument("--out", default="chart_bench.json", help="report path (.json or .csv)")
+    parser.add_argument("--baseline", help="earlier report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    # Bare-mode element calls warn on every chart. Loading the config applies its log
+    # level, so load it first and then quieten Streamlit's loggers
+    st.get_option("logger.level")
+    set_log_level("error")
+    print(f"{'backend':<11} {'kind':<5} {'points':>11} {'sent':>11} {'build (s)':>9} {'payload (MB)':>12} {'peak (MB)':>9}")
+    results = run(args.sizes, args.backends, args.kinds, args.downsample, args.width, args.max_seconds, print_row)
+    write_report(results, args.out, sizes=args.sizes, downsample=args.downsample, width=args.width,
+                 max_seconds=args.max_seconds)
+    print(f"Report written to {args.out}")
+
+    if args.baseline:
+        regressions = compare(read_results(args.baseline), results, args.tolerance)
+        for r in regressions:
+            print(f"Regression: {r['backend']} {r['kind']} at {r['points']:,} points, "
+                  f"{r['field']} {r['baseline']} -> {r['current']}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark())
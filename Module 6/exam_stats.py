@@ -0,0 +1,145 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+SUBJECTS = ['Math', 'Science', 'English', 'History', 'Art']
+
+
+def whiskers(values, q1, q3, lo, hi):
+    """Whisker ends as matplotlib.cbook.boxplot_stats sets them, never inside the box"""
+    upper, lower = values[values <= hi], values[values >= lo]
+    return {'whislo': min(lower.min(), q1) if len(lower) else q1,
+            'whishi': max(upper.max(), q3) if len(upper) else q3}
+
+
+def box_stats(values, label, whis=1.5):
+    """bxp() statistics for one group's raw values, matching Axes.boxplot"""
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    lo, hi = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+    return {
+        'label': label, 'med': med, 'q1': q1, 'q3': q3, **whiskers(values, q1, q3, lo, hi),
+        # Repeated outliers draw on top of each other, so each distinct value is enough
+        'fliers': np.unique(values[(values < lo) | (values > hi)]),
+    }
+
+
+def box_stats_from_counts(grid, counts, label, whis=1.5):
+    """The same statistics from a count per distinct value (grid sorted ascending)"""
+    present = counts > 0
+    grid, counts = grid[present], counts[present]
+    cum = np.cumsum(counts)
+    # np.percentile's linear rule: position q * (n - 1) in the sorted values
+    pos = np.array([0.25, 0.5, 0.75]) * (cum[-1] - 1)
+    below, above = grid[np.searchsorted(cum, np.floor(pos), side='right')], grid[np.searchsorted(cum, np.ceil(pos), side='right')]
+    q1, med, q3 = below + (pos - np.floor(pos)) * (above - below)
+    lo, hi = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+    return {
+        'label': label, 'med': med, 'q1': q1, 'q3': q3, **whiskers(grid, q1, q3, lo, hi),
+        'fliers': grid[(grid < lo) | (grid > hi)],
+    }
+
+
+def summarize_scores(df, bins=10, whis=1.5, max_span=100_000):
+    """Histogram, box-plot and per-date statistics for every subject from one grouped pass
+
+    Integer scores (the usual case) are counted once per (subject, score)
+    with a single bincount; quartiles, whiskers, outliers and histogram
+    bins all come from that small table. Other scores are grouped by
+    subject with one stable argsort and summarized slice by slice. Another
+    bincount gives the mean per exam date. The result is small whatever
+    the row count and feeds hist(weights=...), bxp() and plot() directly.
+    """
+    values = df['Score']
+    scores = values.to_numpy(dtype=np.float64)
+    subject_codes, subjects = pd.factorize(df['Subject'])
+    date_codes, dates = pd.factorize(df['Exam_Date'], sort=True)
+
+    edges = np.histogram_bin_edges(scores, bins)
+    # Equal-width bins, so a bin is arithmetic rather than a search (the last edge is inclusive)
+    width = (edges[-1] - edges[0]) / bins or 1.0
+
+    def bin_of(x):
+        return np.clip(((x - edges[0]) / width).astype(np.int64), 0, bins - 1)
+
+    low = int(edges[0]) if len(scores) else 0
+    span = int(edges[-1]) - low + 1 if len(scores) else 0
+    if pd.api.types.is_integer_dtype(values.dtype) and span <= max_span:
+        table = np.bincount(subject_codes * span + (values.to_numpy() - low),
+                            minlength=len(subjects) * span).reshape(len(subjects), span)
+        grid = np.arange(low, low + span, dtype=np.float64)
+        grid_bins = bin_of(grid)
+        counts = np.array([np.bincount(grid_bins, weights=row, minlength=bins) for row in table]).astype(np.int64)
+        boxes = [box_stats_from_counts(grid, row, subject, whis) for row, subject in zip(table, subjects)]
+    else:
+        counts = np.bincount(subject_codes * bins + bin_of(scores), minlength=len(subjects) * bins)
+        counts = counts.reshape(len(subjects), bins)
+        # Narrow codes let the stable argsort use a radix sort
+        order = np.argsort(subject_codes.astype(np.min_scalar_type(max(len(subjects) - 1, 0))), kind='stable')
+        bounds = np.concatenate(([0], np.cumsum(np.bincount(subject_codes, minlength=len(subjects)))))
+        boxes = [box_stats(scores[order[bounds[i]:bounds[i + 1]]], subject, whis) for i, subject in enumerate(subjects)]
+
+    totals = np.bincount(date_codes, minlength=len(dates))
+    means = np.bincount(date_codes, weights=scores, minlength=len(dates)) / np.maximum(totals, 1)
+    return {
+        'rows': len(scores),
+        'edges': edges,
+        'counts': counts,
+        'subjects': list(subjects),
+        'boxes': boxes,
+        'dates': list(dates),
+        'date_means': means,
+    }
+
+
+def district_scores(rows, seed=0):
+    """Synthetic district results: five subjects, monthly exams, roughly normal scores"""
+    rng = np.random.default_rng(seed)
+    subject = rng.integers(0, len(SUBJECTS), rows)
+    month = rng.integers(1, 10, rows)
+    score = np.clip(np.rint(rng.normal(75 + 2 * subject + month, 10)), 0, 100).astype(np.int16)
+    return pd.DataFrame({
+        'Student': rng.integers(0, max(rows // 15, 1), rows),
+        'Subject': pd.Categorical.from_codes(subject, SUBJECTS),
+        'Score': score,
+        'Exam_Date': pd.Categorical.from_codes(month - 1, [f'2024-{m:02d}-15' for m in range(1, 10)]),
+    })
+
+
+def benchmark(sizes=(100_000, 1_000_000, 10_000_000)):
+    """Raw per-subject filtering and plotting vs one summary pass and bxp(), both rasterized"""
+    import io
+    from matplotlib.figure import Figure
+
+    def raw(df):
+        fig = Figure()
+        ax1, ax2, ax3 = fig.subplots(1, 3)
+        ax1.hist(df['Score'], bins=10)
+        subjects = df['Subject'].unique()
+        ax2.boxplot([df[df['Subject'] == s]['Score'].values for s in subjects], tick_labels=subjects)
+        avg = df.groupby('Exam_Date', observed=True)['Score'].mean()
+        ax3.plot(avg.index.astype(str), avg.values)
+        fig.savefig(io.BytesIO(), format='png')
+
+    def summarized(df):
+        stats = summarize_scores(df)
+        fig = Figure()
+        ax1, ax2, ax3 = fig.subplots(1, 3)
+        ax1.hist(stats['edges'][:-1], bins=stats['edges'], weights=stats['counts'].sum(axis=0))
+        ax2.bxp(stats['boxes'])
+        ax3.plot([str(d) for d in stats['dates']], stats['date_means'])
+        fig.savefig(io.BytesIO(), format='png')
+
+    print(f"{'rows':>12} {'raw (s)':>8} {'summary (s)':>12}")
+    for rows in sizes:
+        df = district_scores(rows)
+        timings = []
+        for fn in (raw, summarized):
+            start = time.perf_counter()
+            fn(df)
+            timings.append(time.perf_counter() - start)
+        print(f"{rows:>12,} {timings[0]:>8.2f} {timings[1]:>12.2f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,108 @@
+import io
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from matplotlib.figure import Figure
+
+
+def data_key(*parts):
+    """Stable hash of chart inputs: frames and arrays by content, containers item by item, the rest by repr"""
+    digest = hashlib.sha1()
+
+    def feed(part):
+        if isinstance(part, (pd.DataFrame, pd.Series, pd.Index)):
+            digest.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+            digest.update(repr(getattr(part, "columns", getattr(part, "name", None))).encode())
+        elif isinstance(part, np.ndarray):
+            digest.update(np.ascontiguousarray(part).tobytes())
+            digest.update(str(part.dtype).encode())
+        elif isinstance(part, dict):
+            for key in sorted(part):
+                feed(key)
+                feed(part[key])
+        elif isinstance(part, (list, tuple)):
+            digest.update(f"{type(part).__name__}{len(part)}".encode())
+            for item in part:
+                feed(item)
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b"|")
+
+    for part in parts:
+        feed(part)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """LRU of rendered PNGs bounded by total bytes
+
+    Charts are drawn on a standalone matplotlib Figure (never pyplot, so
+    nothing is registered globally or left open), rasterized once, and
+    served as PNG bytes for as long as their inputs hash the same.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.images = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.render_ms = 0.0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            png = self.images.get(key)
+            if png is not None:
+                self.images.move_to_end(key)
+                self.hits += 1
+            return png
+
+    def put(self, key, png):
+        with self.lock:
+            if key in self.images:
+                return
+            self.images[key] = png
+            self.nbytes += len(png)
+            while self.nbytes > self.max_bytes and len(self.images) > 1:
+                _, old = self.images.popitem(last=False)
+                self.nbytes -= len(old)
+
+    def render(self, key, draw, figsize=(8, 5), dpi=100):
+        """PNG bytes for `key`, calling draw(fig, ax) only on a miss"""
+        png = self.get(key)
+        if png is not None:
+            return png
+        start = time.perf_counter()
+        fig = Figure(figsize=figsize, dpi=dpi)
+        draw(fig, fig.subplots())
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png")
+        png = buf.getvalue()
+        with self.lock:
+            self.misses += 1
+            self.render_ms += (time.perf_counter() - start) * 1000
+        self.put(key, png)
+        return png
+
+    def summary(self):
+        return (f"Chart cache: {self.hits} hits, {self.misses} renders "
+                f"({self.render_ms / max(self.misses, 1):.0f} ms each), "
+                f"{len(self.images)} images in {self.nbytes / 1024:,.0f} KB")
+
+
+@st.cache_resource
+def get_render_cache():
+    """One render cache per process, shared by every session and page"""
+    return RenderCache()
+
+
+def show_chart(name, inputs, draw, figsize=(8, 5)):
+    """Render (or reuse) a chart keyed on its name and input data, and display it"""
+    cache = get_render_cache()
+    st.image(cache.render(data_key(name, figsize, *inputs), draw, figsize), width="stretch")
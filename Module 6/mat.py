@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+from exam_stats import district_scores, summarize_scores
+from figure_cache import get_render_cache, show_chart
 
 st.title("📊 Exam Performance Analyzer")
 st.write("Upload your grades CSV to analyze student performance patterns")
@@ -17,39 +18,55 @@ sample_data = {
     'Exam_Date': ['2024-01-15'] * 8 + ['2024-02-15'] * 8 + ['2024-03-15'] * 8
 }
 
-df = pd.DataFrame(sample_data)
+# Scale the sample up to a simulated district to see the summaries at work
+@st.cache_resource(max_entries=4)
+def load_scores(rows):
+    return pd.DataFrame(sample_data) if rows == len(sample_data['Score']) else district_scores(rows)
+
+@st.cache_resource(max_entries=4)
+def load_summary(rows):
+    """Histogram bins, box statistics and date means for all subjects, from one pass over the rows"""
+    return summarize_scores(load_scores(rows))
+
+rows = st.sidebar.select_slider("Score rows", [len(sample_data['Score']), 100_000, 1_000_000, 10_000_000],
+                                format_func=lambda n: f"{n:,}")
+df = load_scores(rows)
+stats = load_summary(rows)
 st.write("Sample Data Preview:")
 st.dataframe(df.head())
 
+# Charts are drawn from the compact summaries on standalone Figures and cached as PNGs
 # 1. Grade Distribution Histogram
 st.subheader("📈 Overall Grade Distribution")
-fig1, ax1 = plt.subplots(figsize=(8, 5))
-ax1.hist(df['Score'], bins=10, color='skyblue', alpha=0.7, edgecolor='black')
-ax1.set_xlabel('Score')
-ax1.set_ylabel('Number of Students')
-ax1.set_title('Distribution of Exam Scores')
-ax1.grid(True, alpha=0.3)
-st.pyplot(fig1)
+def draw_histogram(fig, ax1):
+    edges = stats['edges']
+    ax1.hist(edges[:-1], bins=edges, weights=stats['counts'].sum(axis=0),
+             color='skyblue', alpha=0.7, edgecolor='black')
+    ax1.set_xlabel('Score')
+    ax1.set_ylabel('Number of Students')
+    ax1.set_title('Distribution of Exam Scores')
+    ax1.grid(True, alpha=0.3)
+show_chart("score_histogram", [stats['edges'], stats['counts']], draw_histogram)
 
 # 2. Subject-wise Performance Boxplots
 st.subheader("📦 Subject-wise Performance Spread")
-fig2, ax2 = plt.subplots(figsize=(8, 5))
-subjects = df['Subject'].unique()
-subject_scores = [df[df['Subject'] == subject]['Score'].values for subject in subjects]
-ax2.boxplot(subject_scores, tick_labels=subjects)
-ax2.set_ylabel('Score')
-ax2.set_title('Score Distribution by Subject')
-ax2.grid(True, alpha=0.3)
-st.pyplot(fig2)
+def draw_boxplots(fig, ax2):
+    ax2.bxp(stats['boxes'])
+    ax2.set_ylabel('Score')
+    ax2.set_title('Score Distribution by Subject')
+    ax2.grid(True, alpha=0.3)
+show_chart("subject_boxplots", [stats['boxes']], draw_boxplots)
 
 # 3. Average Scores Over Time
 st.subheader("📊 Average Performance Trends")
-avg_by_date = df.groupby('Exam_Date')['Score'].mean()
-fig3, ax3 = plt.subplots(figsize=(8, 5))
-ax3.plot(avg_by_date.index, avg_by_date.values, marker='o', linewidth=2, markersize=8, color='green')
-ax3.set_xlabel('Exam Date')
-ax3.set_ylabel('Average Score')
-ax3.set_title('Class Average Performance Over Time')
-ax3.grid(True, alpha=0.3)
-plt.xticks(rotation=45)
-st.pyplot(fig3)
\ No newline at end of file
+def draw_trend(fig, ax3):
+    ax3.plot([str(d) for d in stats['dates']], stats['date_means'], marker='o', linewidth=2, markersize=8, color='green')
+    ax3.set_xlabel('Exam Date')
+    ax3.set_ylabel('Average Score')
+    ax3.set_title('Class Average Performance Over Time')
+    ax3.grid(True, alpha=0.3)
+    ax3.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+show_chart("average_trend", [stats['dates'], stats['date_means']], draw_trend)
+
+st.sidebar.caption(get_render_cache().summary())
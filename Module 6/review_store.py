@@ -0,0 +1,128 @@
+import io
+import os
+import time
+import sqlite3
+import tempfile
+import threading
+
+import pandas as pd
+
+
+class ReviewStore:
+    """Review history as date-partitioned Parquet plus running aggregates in SQLite
+
+    Each appended upload is split by ReviewDate into
+    reviews/ReviewDate=<day>/<upload hash>.parquet, and its per-day rating
+    sums and counts and per-cuisine counts are added onto the stored
+    totals. Sums and counts merge by addition, so an append costs time in
+    proportion to the new rows, and the dashboard reads the totals without
+    touching the history. Uploads are recorded by content hash, so the
+    same file is never added twice, even by concurrent sessions. Reviews
+    without a parseable date belong to no partition and are not stored.
+    """
+
+    def __init__(self, root="review_history"):
+        self.root = root
+        self.reviews = os.path.join(root, "reviews")
+        os.makedirs(self.reviews, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(root, "aggregates.db"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS uploads (digest TEXT PRIMARY KEY, rows INTEGER, added REAL) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS daily (day TEXT PRIMARY KEY, rating_sum REAL, ratings INTEGER) WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS cuisines (cuisine TEXT PRIMARY KEY, reviews INTEGER) WITHOUT ROWID;"
+        )
+
+    def append(self, df, digest):
+        """Add a parsed upload (read_reviews) once; returns seconds taken, or None if already stored"""
+        start = time.perf_counter()
+        # Claim the hash before writing anything: of two concurrent identical uploads, one wins
+        with self.lock, self.conn:
+            claimed = self.conn.execute("INSERT OR IGNORE INTO uploads VALUES (?, NULL, ?)", (digest, time.time()))
+        if claimed.rowcount == 0:
+            return None
+
+        df = df[df['ReviewDate'].notna()]
+        day = df['ReviewDate'].dt.strftime('%Y-%m-%d')
+        files = []
+        try:
+            for value, part in df.groupby(day, sort=False):
+                folder = os.path.join(self.reviews, f"ReviewDate={value}")
+                os.makedirs(folder, exist_ok=True)
+                files.append(os.path.join(folder, f"{digest}.parquet"))
+                part.drop(columns='ReviewDate').to_parquet(files[-1], index=False)
+
+            rated = df['Rating'].notna()
+            daily = df['Rating'].groupby(day).agg(['sum', 'count'])
+            cuisines = df.loc[rated, 'Cuisine'].value_counts()
+            with self.lock, self.conn:
+                self.conn.executemany(
+                    "INSERT INTO daily VALUES (?, ?, ?) ON CONFLICT(day) DO UPDATE SET "
+                    "rating_sum = rating_sum + excluded.rating_sum, ratings = ratings + excluded.ratings",
+                    ((d, float(s), int(c)) for d, s, c in daily.itertuples()),
+                )
+                self.conn.executemany(
+                    "INSERT INTO cuisines VALUES (?, ?) ON CONFLICT(cuisine) DO UPDATE SET "
+                    "reviews = reviews + excluded.reviews",
+                    ((str(c), int(n)) for c, n in cuisines.items() if n),
+                )
+                # Rows are filled in with the totals, so a claimed but unfinished upload counts for nothing
+                self.conn.execute("UPDATE uploads SET rows = ? WHERE digest = ?", (len(df), digest))
+        except BaseException:
+            for path in files:
+                if os.path.exists(path):
+                    os.remove(path)
+            with self.lock, self.conn:
+                self.conn.execute("DELETE FROM uploads WHERE digest = ?", (digest,))
+            raise
+        return time.perf_counter() - start
+
+    def aggregates(self):
+        """Totals over the whole history, shaped like review_data.aggregate()"""
+        with self.lock:
+            daily = self.conn.execute("SELECT day, rating_sum, ratings FROM daily ORDER BY day").fetchall()
+            cuisines = self.conn.execute("SELECT cuisine, reviews FROM cuisines ORDER BY reviews DESC").fetchall()
+            rows = self.conn.execute("SELECT COALESCE(SUM(rows), 0), COUNT(rows) FROM uploads").fetchone()
+        daily = pd.DataFrame(daily, columns=['ReviewDate', 'rating_sum', 'ratings'])
+        total, ratings = daily['rating_sum'].sum(), daily['ratings'].sum()
+        daily_avg = (daily['rating_sum'] / daily['ratings'].where(daily['ratings'] > 0)).rename('Rating')
+        return {
+            'rows': int(rows[0]),
+            'uploads': int(rows[1]),
+            'daily_avg': daily_avg.set_axis(pd.to_datetime(daily['ReviewDate'])).rename_axis('ReviewDate').to_frame(),
+            'cuisine_reviews': pd.Series(dict(cuisines), name='Reviews', dtype='int64').rename_axis('Cuisine'),
+            'avg_rating': total / ratings if ratings else float('nan'),
+        }
+
+    def history(self):
+        """Every stored review, read back from the partitions"""
+        return pd.read_parquet(self.reviews)
+
+
+def benchmark(days=30, rows_per_day=200_000):
+    """A day's upload appended to the history vs re-uploading the whole history as one CSV"""
+    from review_data import aggregate, content_hash, ingest, read_reviews, synthetic_reviews
+
+    store = ReviewStore(tempfile.mkdtemp())
+    exports = []
+    print(f"{'day':>4} {'history rows':>13} {'append (s)':>11} {'aggregate stored (s)':>21} {'re-ingest all (s)':>18}")
+    for day in range(days):
+        first = (pd.Timestamp('2024-01-01') + pd.Timedelta(days=day)).strftime('%Y-%m-%d')
+        data = synthetic_reviews(rows_per_day, seed=day, start=first, days=1).to_csv(index=False).encode()
+        exports.append(data if day == 0 else data.split(b"\n", 1)[1])
+        start = time.perf_counter()
+        store.append(read_reviews(io.BytesIO(data)), content_hash(data))
+        appended = time.perf_counter() - start
+        if day % 5 == 4:
+            start = time.perf_counter()
+            aggregate(store.history())
+            stored = time.perf_counter() - start
+            start = time.perf_counter()
+            ingest(b"".join(exports))
+            full = time.perf_counter() - start
+            print(f"{day + 1:>4} {store.aggregates()['rows']:>13,} {appended:>11.2f} {stored:>21.2f} {full:>18.2f}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,75 @@
+import streamlit as st
+import plotly.express as px
+from sales_data import generate_sales
+from downsample import METHODS, describe, downsample, plotly_payload, point_budget, savings
+from sales_cube import build_cube, category_region, category_sales, daily_revenue, region_sales
+
+st.title("📈 Sales Analytics Dashboard")
+st.write("Interactive business intelligence for small business owners")
+
+# Sample sales data: 3 months, scalable for load testing. Only the latest raw frame is
+# kept (about 1 GB at 50M rows); the charts read the much smaller cubes below
+@st.cache_resource(max_entries=1)
+def load_sales(rows, days=90, seed=42):
+    """Generate once per (rows, days, seed); the frame is shared read-only by every session"""
+    return generate_sales(rows, start='2024-01-01', days=days, seed=seed)
+
+@st.cache_resource(max_entries=4)
+def load_cube(rows, days=90, seed=42):
+    """Date x Category x Region totals, built once per dataset; every chart rolls these up"""
+    return build_cube(load_sales(rows, days, seed))
+
+@st.cache_data(max_entries=32)
+def trend_points(rows, days, budget, method):
+    """Daily revenue reduced to the chart's point budget, cached per dataset and resolution"""
+    daily = daily_revenue(load_cube(rows, days))
+    points = downsample(daily, 'Date', 'Revenue', budget, method)
+    return points, savings(daily, points, plotly_payload, 'Date', 'Revenue')
+
+rows = st.sidebar.select_slider("Sample rows", [450, 10_000, 1_000_000, 10_000_000, 50_000_000], value=450,
+                                format_func=lambda n: f"{n:,}")
+days = st.sidebar.select_slider("Days of history", [90, 365, 1825, 3650], value=90)
+width = st.sidebar.slider("Trend chart width (px)", 200, 2000, 800, step=100,
+                          help="Long trends are reduced to about one point per pixel before they are sent")
+method = st.sidebar.radio("Downsampling", METHODS, horizontal=True)
+df = load_sales(rows, days)
+cube = load_cube(rows, days)
+st.write("Sample Sales Data Preview:")
+st.dataframe(df.head())
+
+# 1. Interactive Revenue Trend Line Chart
+st.subheader("📊 Revenue Trend Over Time")
+trend, trend_stats = trend_points(rows, days, point_budget(width, method), method)
+fig1 = px.line(trend, x='Date', y='Revenue', 
+               title='Daily Revenue Trend',
+               labels={'Revenue': 'Revenue ($)', 'Date': 'Date'})
+fig1.update_traces(line=dict(width=3, color='#1f77b4'))
+fig1.update_layout(hovermode='x unified')
+st.plotly_chart(fig1, use_container_width=True)
+st.caption(describe(trend_stats))
+
+# 2. Category Breakdown Pie Chart
+st.subheader("🍰 Sales by Product Category")
+fig2 = px.pie(category_sales(cube), values='Revenue', names='Category',
+              title='Revenue Distribution by Category',
+              color_discrete_sequence=px.colors.qualitative.Set3)
+fig2.update_traces(textposition='inside', textinfo='percent+label')
+st.plotly_chart(fig2, use_container_width=True)
+
+# 3. Regional Performance Bar Chart
+st.subheader("🗺️ Regional Sales Performance")
+fig3 = px.bar(region_sales(cube), x='Region', y='Revenue',
+              title='Total Revenue by Region',
+              color='Revenue',
+              color_continuous_scale='viridis')
+fig3.update_traces(texttemplate='$%{y:,.0f}', textposition='outside')
+fig3.update_layout(showlegend=False)
+st.plotly_chart(fig3, use_container_width=True)
+
+# 4. Bonus: Interactive Category-Region Heatmap
+st.subheader("🔥 Category-Region Performance Heatmap")
+fig4 = px.imshow(category_region(cube),
+                 title='Revenue Heatmap: Category vs Region',
+                 aspect='auto',
+                 color_continuous_scale='Blues')
+st.plotly_chart(fig4, use_container_width=True)
\ No newline at end of file
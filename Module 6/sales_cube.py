@@ -0,0 +1,100 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+MEASURES = ['Revenue', 'Units_Sold']
+DAY = np.timedelta64(1, 'D')
+
+
+def _codes(values):
+    """Integer codes and labels for a Category/Region column"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values, sort=True)
+
+
+def build_cube(df):
+    """Revenue, units and order counts per Date x Category x Region, in one pass
+
+    Each row's three keys are folded into one flat cell number and the
+    measures are summed with np.bincount, so the cost is linear in rows and
+    no hash table is built. Empty cells are dropped; the result has at most
+    days x categories x regions rows whatever the size of `df`.
+    """
+    dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+    first = dates.min() if len(dates) else np.datetime64('NaT', 'ns')
+    day = ((dates - first) // DAY).astype(np.int64)
+    cat, categories = _codes(df['Category'])
+    reg, regions = _codes(df['Region'])
+    days = int(day.max()) + 1 if len(day) else 0
+    cells = days * len(categories) * len(regions)
+    cell = (day * len(categories) + cat) * len(regions) + reg
+
+    orders = np.bincount(cell, minlength=cells)
+    sums = {m: np.bincount(cell, weights=df[m].to_numpy(dtype=np.float64), minlength=cells) for m in MEASURES}
+    keep = np.flatnonzero(orders)
+    day_idx, rest = np.divmod(keep, len(categories) * len(regions))
+    cat_idx, reg_idx = np.divmod(rest, len(regions))
+    return pd.DataFrame({
+        'Date': first + day_idx * DAY,
+        'Category': pd.Categorical.from_codes(cat_idx, categories),
+        'Region': pd.Categorical.from_codes(reg_idx, regions),
+        **{m: sums[m][keep] for m in MEASURES},
+        'Orders': orders[keep],
+    })
+
+
+def daily_revenue(cube):
+    return cube.groupby('Date')['Revenue'].sum().reset_index()
+
+
+def category_sales(cube):
+    return cube.groupby('Category', observed=True)['Revenue'].sum().reset_index()
+
+
+def region_sales(cube):
+    return cube.groupby('Region', observed=True)['Revenue'].sum().reset_index()
+
+
+def category_region(cube):
+    """Category x Region revenue table for the heatmap"""
+    return cube.pivot_table(index='Category', columns='Region', values='Revenue', aggfunc='sum', observed=True)
+
+
+def chart_data(cube):
+    return daily_revenue(cube), category_sales(cube), region_sales(cube), category_region(cube)
+
+
+def raw_chart_data(df):
+    """The dashboard's original per-chart groupbys over the raw rows"""
+    heatmap = df.groupby(['Category', 'Region'], observed=True)['Revenue'].sum().reset_index()
+    return (
+        df.groupby('Date')['Revenue'].sum().reset_index(),
+        df.groupby('Category', observed=True)['Revenue'].sum().reset_index(),
+        df.groupby('Region', observed=True)['Revenue'].sum().reset_index(),
+        heatmap.pivot(index='Category', columns='Region', values='Revenue'),
+    )
+
+
+def benchmark(sizes=(10_000, 1_000_000, 10_000_000, 50_000_000)):
+    """Chart data prep from raw rows vs from the cube, plus the one-off cube build"""
+    from sales_data import generate_sales
+
+    def timed(fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, (time.perf_counter() - start) * 1000
+
+    print(f"{'rows':>12} {'raw groupbys (ms)':>18} {'cube build (ms)':>16} {'from cube (ms)':>15} {'cube rows':>10}")
+    for rows in sizes:
+        df = generate_sales(rows)
+        _, raw = timed(raw_chart_data, df)
+        cube, build = timed(build_cube, df)
+        _, derived = timed(chart_data, cube)
+        print(f"{rows:>12,} {raw:>18.0f} {build:>16.0f} {derived:>15.1f} {len(cube):>10,}")
+        del df
+
+
+if __name__ == "__main__":
+    benchmark()
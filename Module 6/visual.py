@@ -1,37 +1,75 @@
+import os
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
+from figure_cache import get_render_cache, show_chart
 import plotly.express as px
+from review_data import content_hash, ingest
+from review_store import ReviewStore
 
 st.title("🍴 Restaurant Review Dashboard")
 st.write("Upload your restaurant review CSV to visualize ratings and review trends.")
 
 # Step 1: Upload CSV
 uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
+append_mode = st.sidebar.toggle("Append uploads to review history",
+                                help="Each new file is added to the stored history and the charts cover every upload so far")
+
+# Parsed frames and aggregates are shared per file content, so an unchanged file is never re-parsed
+@st.cache_resource(max_entries=4)
+def load_reviews(digest, _data):
+    return ingest(_data)
+
+def upload_digest(upload):
+    """Content hash of an upload, computed once per upload rather than on every rerun"""
+    if st.session_state.get("upload_id") != upload.file_id:
+        st.session_state.upload_id = upload.file_id
+        st.session_state.upload_digest = content_hash(upload.getvalue())
+    return st.session_state.upload_digest
+
+# Date-partitioned history with running totals, shared by every session
+@st.cache_resource
+def load_review_store(path):
+    return ReviewStore(path)
+
+store = load_review_store(os.environ.get("REVIEW_HISTORY", "review_history")) if append_mode else None
+aggregates = None
 if uploaded_file:
-    df = pd.read_csv(uploaded_file, parse_dates=['ReviewDate'])
+    digest = upload_digest(uploaded_file)
+    df, aggregates, stats = load_reviews(digest, uploaded_file.getvalue())
     st.write("Review Data Preview:")
     st.dataframe(df.head(10))
-    
+    st.caption(f"{aggregates['rows']:,} reviews parsed in {stats['parse_s']:.2f}s, "
+               f"{stats['memory_mb']:.1f} MB in memory")
+    if store:
+        # Only the new rows are written and merged; a file already in the history is skipped
+        appended = store.append(df, digest)
+        if appended is not None:
+            st.toast(f"Added {aggregates['rows']:,} reviews to the history in {appended:.2f}s")
+
+if store:
+    aggregates = store.aggregates()
+    st.caption(f"History: {aggregates['rows']:,} reviews from {aggregates['uploads']} uploads, "
+               f"{len(aggregates['daily_avg'])} days")
+
+if aggregates and aggregates['rows']:
     # Step 2: Line Chart for Average Ratings Over Time
     st.subheader("📈 Average Ratings Over Time")
-    daily_avg = df.groupby('ReviewDate')['Rating'].mean().reset_index()
-    st.line_chart(daily_avg.set_index('ReviewDate'))
+    st.line_chart(aggregates['daily_avg'])
     
     # Step 3: Bar Chart for Total Reviews by Cuisine
     st.subheader("🏷️ Total Reviews by Cuisine")
-    cuisine_reviews = df.groupby('Cuisine')['Rating'].count().sort_values(ascending=False)
+    cuisine_reviews = aggregates['cuisine_reviews']
     
-    # Matplotlib horizontal bar chart
-    fig, ax = plt.subplots()
-    ax.barh(cuisine_reviews.index, cuisine_reviews.values, color='salmon')
-    ax.set_xlabel('Number of Reviews')
-    ax.set_title('Reviews by Cuisine')
-    st.pyplot(fig)
+    # Matplotlib horizontal bar chart, rendered once per distinct set of counts
+    def draw_cuisines(fig, ax):
+        ax.barh(cuisine_reviews.index, cuisine_reviews.values, color='salmon')
+        ax.set_xlabel('Number of Reviews')
+        ax.set_title('Reviews by Cuisine')
+        fig.tight_layout()
+    show_chart("cuisine_reviews", [cuisine_reviews], draw_cuisines, figsize=(6.4, 4.8))
     
     # Interactive Plotly version
-    fig2 = px.bar(df.groupby('Cuisine')['Rating'].count().reset_index(),
-                  x='Rating', y='Cuisine', orientation='h',
+    fig2 = px.bar(cuisine_reviews.reset_index(),
+                  x='Reviews', y='Cuisine', orientation='h',
                   color='Cuisine', title="Interactive Reviews by Cuisine")
     st.plotly_chart(fig2, use_container_width=True)
     
@@ -42,5 +80,6 @@ if uploaded_file:
         st.metric(f"{i}. {cuisine}", f"{count} reviews")
     
     # Average Rating Across All Restaurants
-    avg_rating = df['Rating'].mean()
+    avg_rating = aggregates['avg_rating']
     st.metric("⭐ Average Rating", f"{avg_rating:.2f}")
+    st.sidebar.caption(get_render_cache().summary())
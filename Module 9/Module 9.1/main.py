@@ -1,34 +1,48 @@
 import streamlit as st
 
-st.title("Login Page")
-
 # Initialize session state
 if "logged_in" not in st.session_state:
     st.session_state.logged_in = False
 if "username" not in st.session_state:
     st.session_state.username = ""
 
-# Show login form if not logged in
-if not st.session_state.logged_in:
-    username = st.text_input("Username")
-    password = st.text_input("Password", type="password")
+# Callbacks run before the script, so the router below already sees the new state
+def log_in():
+    username, password = st.session_state.login_username, st.session_state.login_password
+    # Simple authentication rule
+    if username and password == "demo":
+        st.session_state.logged_in = True
+        st.session_state.username = username
+        st.session_state.login_failed = False
+    else:
+        st.session_state.login_failed = True
+
+def log_out():
+    st.session_state.logged_in = False
+    st.session_state.username = ""
+
+def login():
+    st.title("Login Page")
+    st.text_input("Username", key="login_username")
+    st.text_input("Password", type="password", key="login_password")
+    st.button("Login", on_click=log_in)
+    if st.session_state.get("login_failed"):
+        st.error("Invalid credentials. Hint: password is 'demo'")
 
-    if st.button("Login"):
-        # Simple authentication rule
-        if username and password == "demo":
-            st.session_state.logged_in = True
-            st.session_state.username = username
-            st.success(f"Welcome, {username}!")
-            st.switch_page("pages/1_Dashboard.py")
-        else:
-            st.error("Invalid credentials. Hint: password is 'demo'")
+# Pages are registered on every run; their files are only executed when selected
+app_pages = [
+    st.Page("views/1_Dashboard.py", title="Dashboard", icon="📊", default=True),
+    st.Page("views/2_Reports.py", title="Reports", icon="📑"),
+    st.Page("views/3_Settings.py", title="Settings", icon="⚙️"),
+]
 
-# If already logged in
+# The one auth guard: a logged-out request for any page renders the login form
+# in the same run (and lands on that page after logging in), with no redirect
+if st.session_state.logged_in:
+    page = st.navigation(app_pages)
+    st.sidebar.success(f"Logged in as: {st.session_state.username}")
+    st.sidebar.button("Logout", on_click=log_out)
+    page.run()
 else:
-    st.success(f"Already logged in as: {st.session_state.username}")
-    if st.button("Go to Dashboard"):
-        st.switch_page("pages/1_Dashboard.py")
-    if st.button("Logout"):
-        st.session_state.logged_in = False
-        st.session_state.username = ""
-        st.rerun()
+    st.navigation([st.Page(login, title="Login", icon="🔐")] + app_pages, position="hidden")
+    login()
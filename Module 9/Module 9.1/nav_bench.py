@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+from unittest import mock
+
+from streamlit.runtime.scriptrunner import ScriptRunnerEvent
+from streamlit.testing.v1 import AppTest, app_test
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class CountingRunner(LocalScriptRunner):
+    """Script runner that counts every script execution, including st.switch_page / st.rerun hops"""
+
+    executions = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        def count(sender, event, **_):
+            if event == ScriptRunnerEvent.SCRIPT_STARTED:
+                CountingRunner.executions += 1
+
+        self.on_event.connect(count, weak=False)
+
+
+def press(label):
+    def action(app):
+        return next(b for b in app.button if b.label == label).click()
+    return action
+
+
+def log_in(app):
+    app.text_input[0].input("ada")
+    app.text_input[1].input("demo")
+    return press("Login")(app)
+
+
+def visit(page):
+    return lambda app: app.switch_page(page)
+
+
+NAVIGATIONS = [
+    ("open the app", lambda app: app),
+    ("logged-out visit to Settings", visit("views/3_Settings.py")),
+    ("log in", log_in),
+    ("open Reports", visit("views/2_Reports.py")),
+    ("open Settings", visit("views/3_Settings.py")),
+    ("log out", press("Logout")),
+]
+
+
+def measure(app_dir=HERE):
+    """Script executions and wall time for each navigation in NAVIGATIONS"""
+    app = AppTest.from_file(os.path.join(app_dir, "main.py"), default_timeout=30)
+    print(f"{'navigation':<30} {'executions':>10} {'ms':>8}  page title")
+    with mock.patch.object(app_test, "LocalScriptRunner", CountingRunner):
+        for name, action in NAVIGATIONS:
+            CountingRunner.executions = 0
+            start = time.perf_counter()
+            action(app).run()
+            elapsed = (time.perf_counter() - start) * 1000
+            title = app.title[0].value if len(app.title) else ""
+            print(f"{name:<30} {CountingRunner.executions:>10} {elapsed:>8.1f}  {title}")
+
+
+if __name__ == "__main__":
+    measure(sys.argv[1] if len(sys.argv) > 1 else HERE)
@@ -0,0 +1,10 @@
+import streamlit as st
+
+st.title("📊 Dashboard")
+
+# main.py only routes here once logged in
+st.success(f"Hello, {st.session_state.username}! Welcome to your dashboard.")
+
+# Navigation
+st.page_link("views/2_Reports.py", label="Go to Reports")
+st.page_link("views/3_Settings.py", label="Go to Settings")
@@ -0,0 +1,10 @@
+import streamlit as st
+
+st.title("📑 Reports")
+
+# main.py only routes here once logged in
+st.write(f"{st.session_state.username}, here are your project reports.")
+
+# Navigation
+st.page_link("views/1_Dashboard.py", label="Go to Dashboard")
+st.page_link("views/3_Settings.py", label="Go to Settings")
@@ -0,0 +1,10 @@
+import streamlit as st
+
+st.title("⚙️ Settings")
+
+# main.py only routes here once logged in
+st.write(f"{st.session_state.username}, you can update your settings here.")
+
+# Navigation
+st.page_link("views/1_Dashboard.py", label="Go to Dashboard")
+st.page_link("views/2_Reports.py", label="Go to Reports")
@@ -0,0 +1,109 @@
+import os
+import time
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+FORMATS = ["csv", "parquet", "feather"]
+
+
+def file_format(name):
+    ext = os.path.splitext(name)[1].lower().lstrip(".")
+    return {"pq": "parquet", "arrow": "feather", "ipc": "feather"}.get(ext, ext)
+
+
+def read_upload(file, arrow=False):
+    """Load a whole CSV, Parquet or Feather upload; `arrow` keeps columns in Arrow dtypes"""
+    fmt = file_format(file.name)
+    backend = {"dtype_backend": "pyarrow"} if arrow else {}
+    if fmt == "parquet":
+        return pd.read_parquet(file, **backend)
+    if fmt == "feather":
+        return pd.read_feather(file, **backend)
+    if arrow:
+        return pd.read_csv(file, engine="pyarrow", **backend)
+    return pd.read_csv(file)
+
+
+def read_chunks(file, chunksize, arrow=False):
+    """Yield (chunk, fraction of the upload consumed) for any supported format"""
+    fmt = file_format(file.name)
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        reader = pq.ParquetFile(file)
+        total, done = reader.metadata.num_rows, 0
+        for batch in reader.iter_batches(batch_size=chunksize):
+            done += batch.num_rows
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype if arrow else None), done / max(total, 1)
+    elif fmt == "feather":
+        import pyarrow.ipc as ipc
+
+        reader = ipc.open_file(file)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype if arrow else None), (i + 1) / reader.num_record_batches
+    else:
+        size = getattr(file, "size", None)
+        backend = {"dtype_backend": "pyarrow"} if arrow else {}
+        # Closing the reader (also when the generator is abandoned) leaves the upload itself open
+        with pd.read_csv(file, chunksize=chunksize, **backend) as reader:
+            for chunk in reader:
+                yield chunk, file.tell() / size if size else 0.0
+
+
+def write_parquet(data):
+    """Write a frame to a temporary Parquet file and return its path
+
+    Columns that mix values (e.g. numbers and "N/A" fills) are stored as
+    strings, since a Parquet column needs a single type.
+    """
+    mixed = {col: "string" for col in data.columns if data[col].dtype == object}
+    path = tempfile.NamedTemporaryFile(suffix=".parquet", delete=False).name
+    data.astype(mixed).to_parquet(path, index=False)
+    return path
+
+
+def wide_export(rows, text_cols=40, num_cols=20, seed=0):
+    """Synthetic wide export: repetitive text codes plus numeric measures"""
+    rng = np.random.default_rng(seed)
+    words = np.array([f"value_{i:04d}" for i in range(2_000)], dtype=object)
+    frame = {f"text_{i}": words[rng.integers(0, len(words), rows)] for i in range(text_cols)}
+    frame.update({f"num_{i}": np.round(rng.normal(100, 20, rows), 3) for i in range(num_cols)})
+    return pd.DataFrame(frame)
+
+
+def benchmark(rows=500_000, text_cols=40, num_cols=20):
+    """Ingest time and frame memory: object dtype vs Arrow dtypes, CSV vs Parquet"""
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "export.csv")
+    parquet_path = os.path.join(directory, "export.parquet")
+    data = wide_export(rows, text_cols, num_cols)
+    data.to_csv(csv_path, index=False)
+    data.to_parquet(parquet_path, index=False)
+    print(f"{rows:,} rows × {text_cols + num_cols} columns, CSV {os.path.getsize(csv_path) / 1e6:.0f} MB")
+
+    def object_csv():
+        with pd.option_context("future.infer_string", False):
+            return pd.read_csv(csv_path)
+
+    cases = {
+        "CSV, C engine, object": object_csv,
+        "CSV, pyarrow engine, Arrow": lambda: pd.read_csv(csv_path, engine="pyarrow", dtype_backend="pyarrow"),
+        "Parquet, Arrow": lambda: pd.read_parquet(parquet_path, dtype_backend="pyarrow"),
+    }
+    print(f"{'ingest':<28} {'seconds':>8} {'memory (MB)':>12}")
+    for label, load in cases.items():
+        start = time.perf_counter()
+        frame = load()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<28} {elapsed:>8.2f} {frame.memory_usage(deep=True).sum() / 1e6:>12.0f}")
+        del frame
+    for path in (csv_path, parquet_path):
+        os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    benchmark()
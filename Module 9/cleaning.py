@@ -0,0 +1,331 @@
+import os
+import time
+import tempfile
+import tracemalloc
+from itertools import chain
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+STEPS = ["Remove duplicates", "Handle missing", "Standardize text"]
+
+
+class SeenRows:
+    """Set of 64-bit row hashes kept as a few sorted NumPy arrays
+
+    New hashes land in a small level; whenever two levels reach the same
+    size they are merged (like a binary counter), so inserts stay cheap
+    and membership is a binary search per level. Memory is 8 bytes per
+    distinct row, versus ~70 bytes per entry for a Python set of ints.
+    """
+
+    def __init__(self):
+        self.levels = []
+
+    def __len__(self):
+        return sum(len(level) for level in self.levels)
+
+    def contains(self, hashes):
+        found = np.zeros(len(hashes), dtype=bool)
+        for level in self.levels:
+            pos = np.searchsorted(level, hashes)
+            pos[pos == len(level)] = 0
+            found |= level[pos] == hashes
+        return found
+
+    def add(self, hashes):
+        if len(hashes) == 0:
+            return
+        level = np.unique(hashes)
+        while self.levels and len(self.levels[-1]) <= len(level):
+            level = np.union1d(self.levels.pop(), level)
+        self.levels.append(level)
+
+
+def row_hashes(chunk):
+    """64-bit hash per row; numbers are hashed as float64 so 1 and 1.0 match across chunks"""
+    numeric = chunk.select_dtypes("number").columns
+    return pd.util.hash_pandas_object(chunk.astype({c: "float64" for c in numeric}), index=False).to_numpy()
+
+
+def is_text(values):
+    return values.dtype == object or pd.api.types.is_string_dtype(values.dtype)
+
+
+def text_columns(data, steps):
+    """Columns run_plan would standardize for the whole frame"""
+    fill = "Handle missing" in steps
+    return [col for col in data.columns if is_text(data[col]) or (fill and data[col].isna().any())]
+
+
+def match_dtypes(chunk, dtypes):
+    """Give a later chunk the number types the first chunk had
+
+    Whether a column reads as integer or float depends on whether that
+    chunk happens to have gaps, and 5 writes as "5" or "5.0" accordingly.
+    Integers follow a float first chunk, and whole-number floats go back
+    to a (nullable) integer when the first chunk had one.
+    """
+    cast = {}
+    for col, dtype in dtypes.items():
+        values = chunk.get(col)
+        if values is None or values.dtype == dtype:
+            continue
+        if dtype.kind == "f" and values.dtype.kind in "iu":
+            cast[col] = dtype
+        elif dtype.kind in "iu" and values.dtype.kind == "f" and (values.dropna() % 1 == 0).all():
+            cast[col] = dtype if isinstance(dtype, pd.ArrowDtype) else "Int64"
+    return chunk.astype(cast) if cast else chunk
+
+
+def standardize(values):
+    """Strip and title-case text, once per distinct value instead of once per row"""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    fixed = pd.Index(uniques.astype(str)).str.strip().str.title()
+    return pd.Series(fixed.take(codes), index=values.index, name=values.name)
+
+
+@contextmanager
+def measure(report, step):
+    """Time a plan stage and, while tracemalloc is on, record its peak allocation"""
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    row = {"Step": step, "Result": ""}
+    yield row
+    row["Time (ms)"] = round((time.perf_counter() - start) * 1000, 1)
+    if tracing:
+        row["Peak memory (MB)"] = round(tracemalloc.get_traced_memory()[1] / 1e6, 1)
+    report.append(row)
+
+
+def run_plan(data, steps, track_memory=False, text_cols=None):
+    """Run the selected steps as one fused plan and return (cleaned, report)
+
+    Every stage works column by column on the rows that survive
+    deduplication: the duplicate mask is computed once, each column is
+    selected once, filled only if it actually has gaps, and standardized
+    over its distinct values. The frame is assembled a single time at the
+    end. `text_cols` overrides which columns count as text, so partitions
+    of one frame all treat the same columns alike. The report has one row
+    per stage with its result and time, plus peak memory when
+    `track_memory` is set (tracemalloc makes the run several times slower).
+    """
+    started = track_memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    report = []
+    columns = {col: data[col] for col in data.columns}
+    try:
+        if "Remove duplicates" in steps:
+            with measure(report, "Remove duplicates") as row:
+                keep = ~data.duplicated().to_numpy()
+                row["Count"] = int((~keep).sum())
+                if row["Count"]:
+                    columns = {col: values[keep] for col, values in columns.items()}
+                row["Result"] = f"Removed {row['Count']} duplicates"
+
+        if "Handle missing" in steps:
+            with measure(report, "Handle missing") as row:
+                row["Count"] = 0
+                for col, values in columns.items():
+                    missing = int(values.isna().sum())
+                    if missing:
+                        # Arrow-backed numbers cannot hold the "N/A" marker, so they become object like NumPy ones
+                        columns[col] = (values if is_text(values) else values.astype(object)).fillna("N/A")
+                        row["Count"] += missing
+                row["Result"] = f"Filled {row['Count']} missing values"
+
+        if "Standardize text" in steps:
+            with measure(report, "Standardize text") as row:
+                # Like the step-by-step cleaner, columns turned into text by "N/A" fills count too
+                if text_cols is None:
+                    text_cols = [col for col, values in columns.items() if is_text(values)]
+                for col in text_cols:
+                    columns[col] = standardize(columns[col])
+                row["Count"] = len(text_cols)
+                row["Result"] = f"Standardized text in {len(text_cols)} columns"
+
+        with measure(report, "Assemble") as row:
+            cleaned = pd.DataFrame(columns, columns=data.columns) if columns else data.iloc[0:0]
+            row["Result"] = f"{len(cleaned)} rows × {len(cleaned.columns)} columns"
+    finally:
+        if started:
+            tracemalloc.stop()
+    return cleaned, report
+
+
+def clean_partition(part, steps, text_cols=None):
+    """Worker task: dedupe and clean one partition, keeping what the global merge needs
+
+    Returns the cleaned rows with the hashes of their raw values and their
+    missing-value counts, so the parent can drop rows already seen in
+    earlier partitions and keep the step counts exact.
+    """
+    result = {"rows": len(part), "hashes": None, "missing": None}
+    if "Remove duplicates" in steps:
+        hashes = row_hashes(part)
+        keep = ~pd.Series(hashes).duplicated().to_numpy()
+        if not keep.all():
+            part = part[keep]
+        result["hashes"] = hashes[keep]
+    if "Handle missing" in steps:
+        result["missing"] = part.isna().sum(axis=1).to_numpy()
+    steps = [s for s in steps if s != "Remove duplicates"]
+    result["cleaned"], report = run_plan(part, steps, text_cols=text_cols)
+    result["text_cols"] = next((r["Count"] for r in report if r["Step"] == "Standardize text"), 0)
+    return result
+
+
+def merge_partition(result, seen, summary):
+    """Drop rows whose raw values appeared in an earlier partition and update the counts"""
+    cleaned = result["cleaned"]
+    if result["hashes"] is not None:
+        dup = seen.contains(result["hashes"])
+        seen.add(result["hashes"][~dup])
+        if dup.any():
+            cleaned = cleaned[~dup]
+            if result["missing"] is not None:
+                result["missing"] = result["missing"][~dup]
+        summary["Remove duplicates"] += result["rows"] - len(cleaned)
+    if result["missing"] is not None:
+        summary["Handle missing"] += int(result["missing"].sum())
+    if "Standardize text" in summary:
+        summary["Standardize text"] = max(summary["Standardize text"], result["text_cols"])
+    summary["rows_in"] += result["rows"]
+    summary["rows_out"] += len(cleaned)
+    return cleaned
+
+
+def ordered_results(parts, steps, executor=None, inflight=None, text_cols=None):
+    """Yield (clean_partition result, tag) in input order from (part, tag) pairs
+
+    With an executor, at most `inflight` partitions are queued at once, so
+    a streamed file never has more than that many chunks in memory.
+    """
+    if executor is None:
+        for part, tag in parts:
+            yield clean_partition(part, steps, text_cols), tag
+        return
+    pending = deque()
+    for part, tag in parts:
+        pending.append((executor.submit(clean_partition, part, steps, text_cols), tag))
+        if len(pending) >= inflight:
+            future, tag = pending.popleft()
+            yield future.result(), tag
+    while pending:
+        future, tag = pending.popleft()
+        yield future.result(), tag
+
+
+def new_summary(steps):
+    return {"rows_in": 0, "rows_out": 0, "chunks": 0, **{step: 0 for step in steps}}
+
+
+def parallel_clean(data, steps, executor, workers):
+    """Clean an in-memory frame across a process pool, preserving row order
+
+    The frame is split into `workers` contiguous partitions. Each one is
+    deduplicated and cleaned in its own process, and a global hash merge in
+    the parent removes duplicates that span partitions.
+    """
+    report = []
+    summary = new_summary(steps)
+    with measure(report, "Partition") as row:
+        bounds = np.linspace(0, len(data), workers + 1).astype(int)
+        parts = [(data.iloc[lo:hi], i) for i, (lo, hi) in enumerate(zip(bounds[:-1], bounds[1:])) if hi > lo]
+        row["Result"] = f"{len(parts)} partitions"
+    with measure(report, "Clean partitions") as row:
+        text_cols = text_columns(data, steps)
+        results = list(ordered_results(parts, steps, executor, inflight=len(parts) or 1, text_cols=text_cols))
+        row["Result"] = f"{workers} worker processes"
+    with measure(report, "Global dedupe") as row:
+        seen = SeenRows()
+        pieces = [merge_partition(result, seen, summary) for result, _ in results]
+        row["Result"] = "; ".join(
+            f"{step}: {summary[step]}" for step in ("Remove duplicates", "Handle missing") if step in steps
+        ) or "Skipped"
+    with measure(report, "Assemble") as row:
+        cleaned = pd.concat(pieces) if pieces else data.iloc[0:0]
+        row["Result"] = f"{len(cleaned)} rows × {len(cleaned.columns)} columns"
+    return cleaned, report
+
+
+def stream_clean(chunks, steps, on_progress=None, executor=None, workers=1):
+    """Clean (chunk, fraction) pairs, e.g. from arrow_io.read_chunks, into a temporary CSV file
+
+    Only a few chunks plus the row-hash set are in memory at a time. With
+    an executor, up to two chunks per worker are cleaned in parallel and
+    written back in file order. Returns the output path and a summary
+    dict. `on_progress(fraction, summary)` is called after every chunk with
+    the share of the input consumed. Column types and the set of text
+    columns are fixed by the first chunk, so the output matches the
+    in-memory cleaner unless a column's type is only revealed by later
+    rows (e.g. gaps first appearing past the first chunk). The caller
+    owns the file and must delete it; it is removed here only if
+    cleaning fails.
+    """
+    seen = SeenRows()
+    summary = new_summary(steps)
+    # Every chunk standardizes the columns the first one does, as parallel_clean's partitions do
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    text_cols, parts = None, []
+    if first is not None:
+        text_cols, dtypes = text_columns(first[0], steps), first[0].dtypes
+        parts = chain([first], ((match_dtypes(chunk, dtypes), fraction) for chunk, fraction in chunks))
+    out = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="", encoding="utf-8")
+    try:
+        with out:
+            for result, fraction in ordered_results(parts, steps, executor, 2 * workers, text_cols):
+                cleaned = merge_partition(result, seen, summary)
+                cleaned.to_csv(out, header=summary["chunks"] == 0, index=False)
+                summary["chunks"] += 1
+                if on_progress:
+                    on_progress(min(fraction, 1.0), summary)
+    except BaseException:
+        os.remove(out.name)
+        raise
+    return out.name, summary
+
+
+def synthetic_frame(rows, seed=0):
+    """Messy customer-style data: padded mixed-case text, gaps and ~5% duplicate rows"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"  customer {i} " if i % 3 else f"CUSTOMER {i}" for i in range(50_000)], dtype=object)
+    cities = np.array(["paris", " Rome", "BERLIN ", "madrid", None], dtype=object)
+    frame = pd.DataFrame({
+        "name": names[rng.integers(0, len(names), rows)],
+        "city": cities[rng.integers(0, len(cities), rows)],
+        "amount": np.round(rng.uniform(1, 500, rows), 2),
+        "visits": rng.integers(0, 100, rows),
+    })
+    frame.loc[rng.random(rows) < 0.02, "amount"] = np.nan
+    dupes = rng.integers(0, rows, rows // 20)
+    frame.iloc[rng.integers(0, rows, rows // 20)] = frame.iloc[dupes].to_numpy()
+    return frame
+
+
+def benchmark(rows=10_000_000, worker_counts=(1, 2, 4, 8)):
+    """Wall time of parallel_clean at several worker counts on a synthetic frame"""
+    data = synthetic_frame(rows)
+    print(f"{rows:,} rows")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8}")
+    baseline = None
+    for workers in worker_counts:
+        with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+            pool.submit(int).result()  # start-up cost is not part of the measurement
+            start = time.perf_counter()
+            parallel_clean(data, STEPS, pool, workers)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    benchmark()
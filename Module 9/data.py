@@ -1,48 +1,113 @@
+import os
+import weakref
 import streamlit as st
 import pandas as pd
-import time
-
-# Cleaning function
-
-def clean_step(data, step, progress, i, total):
-    time.sleep(1)
-    if step == "Remove duplicates":
-        cleaned = data.drop_duplicates()
-        status = f"Removed {len(data) - len(cleaned)} duplicates"
-    elif step == "Handle missing":
-        cleaned = data.fillna("N/A")
-        status = "Filled missing values"
-    elif step == "Standardize text":
-        cleaned = data.copy()
-        for col in cleaned.select_dtypes('object'):
-            cleaned[col] = cleaned[col].astype(str).str.strip().str.title()
-        status = f"Standardized text in {len(cleaned.select_dtypes('object').columns)} columns"
-    else:
-        cleaned = data
-        status = "Step complete"
-    progress.progress((i + 1)/total)
-    return cleaned, status
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from arrow_io import FORMATS, read_chunks, read_upload, write_parquet
+from cleaning import STEPS, parallel_clean, run_plan, stream_clean
+from profiling import frame_chunks, profile_chunks
+
+# One worker pool per size, shared by every session
+@st.cache_resource
+def get_pool(workers):
+    return ProcessPoolExecutor(workers, mp_context=get_context("spawn"))
+
+class OutputFile:
+    """A cleaned file on disk, deleted when replaced, when its session ends, or at exit"""
+
+    def __init__(self, path):
+        self.path = path
+        self.remove = weakref.finalize(self, lambda: os.path.exists(path) and os.remove(path))
+
+    def open(self):
+        # Handed to Streamlit, which reads it on click and drops it, closing the file
+        return open(self.path, "rb")
+
+def keep_output(path):
+    """Make `path` this session's download, deleting the file from the previous run"""
+    previous = st.session_state.pop("output", None)
+    if previous is not None:
+        previous.remove()
+    st.session_state.output = OutputFile(path)
+    return st.session_state.output
+
+def show_profile(chunks):
+    status = st.empty()
+    summary, rows = profile_chunks(
+        chunks, on_progress=lambda rows, secs: status.text(f"Profiled {rows:,} rows in {secs:.1f}s...")
+    )
+    status.text(f"✅ Profiled {rows:,} rows")
+    st.dataframe(summary, hide_index=True)
 
 # --- Streamlit UI ---
 st.title("✨ Quick Data Cleaner")
-uploaded_file = st.file_uploader("Upload CSV", type="csv")
+uploaded_file = st.file_uploader("Upload a CSV, Parquet or Feather file", type=FORMATS)
+arrow = st.toggle("Arrow dtypes", help="Load columns as Arrow-backed types: less memory and faster text handling")
+streaming = st.toggle("Streaming mode (large files)", help="Clean the file chunk by chunk instead of loading it all")
+steps = st.multiselect("Cleaning steps", STEPS, default=STEPS)
+workers = st.slider("Worker processes", 1, max(os.cpu_count() or 1, 2), 1)
+pool = get_pool(workers) if workers > 1 else None
 
-if uploaded_file:
-    data = pd.read_csv(uploaded_file)
-    st.success(f"Loaded {len(data)} rows, {len(data.columns)} columns")
-    st.dataframe(data.head())
+if uploaded_file and streaming:
+    chunksize = st.number_input("Rows per chunk", 10_000, 1_000_000, 100_000, step=10_000)
+    st.dataframe(next(read_chunks(uploaded_file, 5, arrow))[0].head())
+
+    if st.button("🔎 Profile columns"):
+        uploaded_file.seek(0)
+        show_profile(chunk for chunk, _ in read_chunks(uploaded_file, int(chunksize), arrow))
 
     if st.button("Start Cleaning"):
-        steps = ["Remove duplicates", "Handle missing", "Standardize text"]
+        uploaded_file.seek(0)
+        # The previous run's output goes before a new one is written
+        if "output" in st.session_state:
+            st.session_state.pop("output").remove()
         progress = st.progress(0)
         status_text = st.empty()
-        cleaned = data.copy()
 
-        for i, step in enumerate(steps):
-            status_text.text(f"Step {i+1}/{len(steps)}: {step}...")
-            cleaned, step_status = clean_step(cleaned, step, progress, i, len(steps))
-            status_text.text(f"✅ {step_status}")
+        def report(fraction, summary):
+            progress.progress(fraction)
+            status_text.text(f"Chunk {summary['chunks']}: {summary['rows_in']:,} rows read, "
+                             f"{summary['rows_out']:,} written ({fraction:.0%} of input)")
+
+        path, summary = stream_clean(read_chunks(uploaded_file, int(chunksize), arrow), steps, on_progress=report,
+                                     executor=pool, workers=workers)
+        progress.progress(1.0)
+        st.success("🎉 Cleaning complete!")
+        if "Remove duplicates" in steps:
+            st.write(f"✅ Removed {summary['Remove duplicates']:,} duplicates")
+        if "Handle missing" in steps:
+            st.write(f"✅ Filled {summary['Handle missing']:,} missing values")
+        if "Standardize text" in steps:
+            st.write(f"✅ Standardized text in {summary['Standardize text']} columns")
+        st.subheader("Cleaned Data")
+        st.dataframe(pd.read_csv(path, nrows=5))
+        # Read from disk only when clicked, off the script thread, rather than on every rerun
+        output = keep_output(path)
+        st.download_button("⬇️ Download cleaned CSV", output.open, file_name="cleaned.csv", mime="text/csv",
+                           on_click="ignore")
+
+elif uploaded_file:
+    data = read_upload(uploaded_file, arrow)
+    st.success(f"Loaded {len(data)} rows, {len(data.columns)} columns")
+    st.dataframe(data.head())
+
+    if st.button("🔎 Profile columns"):
+        show_profile(frame_chunks(data))
+
+    track_memory = st.checkbox("Measure peak memory per step (slower)")
+
+    if st.button("Start Cleaning"):
+        with st.spinner("Cleaning..."):
+            if pool:
+                cleaned, report = parallel_clean(data, steps, pool, workers)
+            else:
+                cleaned, report = run_plan(data, steps, track_memory=track_memory)
 
         st.success("🎉 Cleaning complete!")
+        st.dataframe(pd.DataFrame(report).drop(columns="Count", errors="ignore"), hide_index=True)
         st.subheader("Cleaned Data")
-        st.dataframe(cleaned.head())
\ No newline at end of file
+        st.dataframe(cleaned.head())
+        output = keep_output(write_parquet(cleaned))
+        st.download_button("⬇️ Download cleaned Parquet", output.open, file_name="cleaned.parquet",
+                           mime="application/vnd.apache.parquet", on_click="ignore")
\ No newline at end of file
@@ -0,0 +1,135 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def value_hashes(values):
+    """64-bit hashes of non-null values; numbers hash as float64 so chunks agree"""
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        values = values.astype("float64")
+    return pd.util.hash_array(values.to_numpy())
+
+
+class HyperLogLog:
+    """Distinct-count sketch: 2**p one-byte registers, about 1.04 / sqrt(2**p) relative error"""
+
+    def __init__(self, p=14):
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add(self, hashes):
+        if len(hashes) == 0:
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        bucket = (hashes & np.uint64(self.m - 1)).astype(np.int64)
+        rest = hashes >> np.uint64(self.p)
+
+        # Rank = position of the first 1-bit in the remaining 64 - p bits
+        bits = np.frexp(rest.astype(np.float64))[1].astype(np.int64)
+        rounded_up = (bits > 0) & ((rest >> np.maximum(bits - 1, 0).astype(np.uint64)) == 0)
+        bits -= rounded_up
+        rank = (64 - self.p) - bits + 1
+
+        # Max rank per bucket via presence counts instead of a Python loop
+        width = 64 - self.p + 2
+        seen = np.bincount(bucket * width + rank, minlength=self.m * width).reshape(self.m, width) > 0
+        best = np.where(seen.any(axis=1), width - 1 - np.argmax(seen[:, ::-1], axis=1), 0)
+        np.maximum(self.registers, best.astype(np.uint8), out=self.registers)
+
+    def estimate(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * np.log(m / zeros)
+        return raw
+
+
+class TopValues:
+    """Mergeable Misra-Gries summary of the most frequent values
+
+    Keeps at most `capacity` counters. Any value occurring more than
+    n / (capacity + 1) times is guaranteed to be kept, and each count is
+    an underestimate by at most that much.
+    """
+
+    def __init__(self, capacity=200):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+
+    def add(self, counts):
+        """Merge a value -> count Series (e.g. from value_counts) into the summary"""
+        merged = self.counts.add(counts, fill_value=0)
+        if len(merged) > self.capacity:
+            cut = merged.nlargest(self.capacity + 1).iloc[-1]
+            merged = merged[merged > cut] - cut
+        self.counts = merged.astype("int64")
+
+    def top(self, k=5):
+        return self.counts.nlargest(k)
+
+
+class ColumnProfile:
+    def __init__(self, dtype):
+        self.dtype = str(dtype)
+        self.rows = 0
+        self.nulls = 0
+        self.min = None
+        self.max = None
+        self.distinct = HyperLogLog()
+        self.top = TopValues()
+
+    def add(self, values):
+        self.rows += len(values)
+        present = values.dropna()
+        self.nulls += len(values) - len(present)
+        if present.empty:
+            return
+        if pd.api.types.is_numeric_dtype(present.dtype) or pd.api.types.is_datetime64_any_dtype(present.dtype):
+            lo, hi = present.min(), present.max()
+            self.min = lo if self.min is None else min(self.min, lo)
+            self.max = hi if self.max is None else max(self.max, hi)
+        # HyperLogLog ignores repeats, so hashing the distinct values is enough
+        counts = present.value_counts()
+        self.distinct.add(value_hashes(counts.index.to_series()))
+        self.top.add(counts)
+
+    def summary(self, k=3):
+        top = self.top.top(k)
+        return {
+            "Type": self.dtype,
+            "Null %": round(100 * self.nulls / self.rows, 2) if self.rows else 0.0,
+            "≈ Distinct": int(round(self.distinct.estimate())),
+            "Top values": ", ".join(f"{value} (≥{count:,})" for value, count in top.items()),
+            "Min": self.min,
+            "Max": self.max,
+        }
+
+
+def profile_chunks(chunks, on_progress=None):
+    """Profile every column in one pass over an iterable of DataFrame chunks
+
+    Memory per column is fixed (16 KB of HyperLogLog registers plus 200
+    top-value counters), however many rows stream past. Returns a summary
+    DataFrame and the number of rows seen.
+    """
+    profiles = {}
+    rows = 0
+    start = time.perf_counter()
+    for chunk in chunks:
+        for col in chunk.columns:
+            profiles.setdefault(col, ColumnProfile(chunk[col].dtype)).add(chunk[col])
+        rows += len(chunk)
+        if on_progress:
+            on_progress(rows, time.perf_counter() - start)
+    summary = [{"Column": col, **profile.summary()} for col, profile in profiles.items()]
+    return pd.DataFrame(summary), rows
+
+
+def frame_chunks(data, chunksize=1_000_000):
+    """Slice an in-memory frame into views for profile_chunks"""
+    for start in range(0, len(data), chunksize):
+        yield data.iloc[start:start + chunksize]
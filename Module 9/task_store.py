@@ -0,0 +1,128 @@
+import html
+import os
+import time
+import sqlite3
+import tempfile
+import threading
+
+import streamlit as st
+
+
+class TaskStore:
+    """SQLite task list: every add, toggle and delete writes just its own row"""
+
+    def __init__(self, path="tasks.db"):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks (id INTEGER PRIMARY KEY, text TEXT NOT NULL, done INTEGER NOT NULL)"
+        )
+
+    def all(self):
+        """Task ID -> {"text", "done"}, oldest first"""
+        with self.lock:
+            rows = self.conn.execute("SELECT id, text, done FROM tasks ORDER BY id").fetchall()
+        return {task_id: {"text": text, "done": bool(done)} for task_id, text, done in rows}
+
+    def add(self, text):
+        with self.lock, self.conn:
+            return self.conn.execute("INSERT INTO tasks (text, done) VALUES (?, 0)", (text,)).lastrowid
+
+    def bulk_add(self, texts):
+        with self.lock, self.conn:
+            self.conn.executemany("INSERT INTO tasks (text, done) VALUES (?, 0)", ((t,) for t in texts))
+
+    def set_done(self, task_id, done):
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE tasks SET done = ? WHERE id = ?", (int(done), task_id))
+
+    def delete(self, task_id):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+
+
+@st.cache_resource
+def load_task_store(path="tasks.db"):
+    return TaskStore(path)
+
+
+def get_tasks(store):
+    """This session's view of the task list, loaded from the store on first use"""
+    if "tasks" not in st.session_state:
+        st.session_state.tasks = store.all()
+    return st.session_state.tasks
+
+
+def toggle_task(store, task_id):
+    task = st.session_state.tasks[task_id]
+    task["done"] = not task["done"]
+    store.set_done(task_id, task["done"])
+
+
+def delete_task(store, task_id):
+    st.session_state.tasks.pop(task_id, None)
+    store.delete(task_id)
+
+
+@st.fragment
+def task_row(store, task_id):
+    """One task; its buttons rerun only this fragment, and a deleted task renders nothing"""
+    task = st.session_state.tasks.get(task_id)
+    if task is None:
+        return
+    col1, col2, col3 = st.columns([3, 1, 1])
+
+    with col1:
+        style = "text-decoration: line-through; color: gray;" if task['done'] else ""
+        # Tasks are shared by every session, so their text is escaped rather than trusted as HTML
+        st.markdown(f"<span style='{style}'>{html.escape(task['text'])}</span>", unsafe_allow_html=True)
+
+    with col2:
+        status = "✅ Done" if task['done'] else "✔️ Mark Done"
+        st.button(status, key=f"toggle_{task_id}", on_click=toggle_task, args=(store, task_id))
+
+    with col3:
+        st.button("🗑️ Delete", key=f"delete_{task_id}", on_click=delete_task, args=(store, task_id))
+
+
+def _single_row(path, task_id):
+    # Runs inside AppTest: the work a fragment rerun does for one row
+    from task_store import get_tasks, load_task_store, task_row
+
+    store = load_task_store(path)
+    get_tasks(store)
+    task_row(store, task_id)
+
+
+def benchmark(sizes=(10, 100, 1_000, 5_000), script=os.path.join(os.path.dirname(__file__), "task.py")):
+    """Toggle latency: a full-script rerun vs a rerun of the toggled row's fragment
+
+    A full rerun renders every row, which is what each toggle used to cost
+    and what adding a task still costs. The fragment figure is one row
+    rendered after its toggle, against a store holding the same number of
+    tasks.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    print(f"{'tasks':>6} {'full rerun (ms)':>16} {'row fragment (ms)':>18}")
+    for size in sizes:
+        path = os.path.join(tempfile.mkdtemp(), "tasks.db")
+        TaskStore(path).bulk_add(f"Task {i}" for i in range(size))
+        os.environ["TASKS_DB"] = path
+
+        app = AppTest.from_file(script, default_timeout=600).run()
+        start = time.perf_counter()
+        app.button(key=f"toggle_{size // 2}").click().run()
+        full = time.perf_counter() - start
+
+        row = AppTest.from_function(_single_row, args=(path, size // 2)).run()
+        start = time.perf_counter()
+        row.button(key=f"toggle_{size // 2}").click().run()
+        fragment = time.perf_counter() - start
+        print(f"{size:>6} {full * 1000:>16.0f} {fragment * 1000:>18.0f}")
+    os.environ.pop("TASKS_DB", None)
+
+
+if __name__ == "__main__":
+    benchmark()
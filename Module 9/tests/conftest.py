@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The modules under test sit next to the app scripts, which import them by name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,74 @@
+import os
+import json
+import threading
+
+import pytest
+
+from uni_client import ResponseCache, UniversityClient, serve_fixtures
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "universities.json")
+
+
+@pytest.fixture
+def fixtures():
+    with open(FIXTURES) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def test_retries_after_503(fixtures, cache_path):
+    server, url = serve_fixtures(fixtures, fail_first=2)
+    try:
+        client = UniversityClient(url, cache=ResponseCache(cache_path), retries=3, backoff=0)
+        assert client.universities("Iceland") == fixtures["Iceland"]
+    finally:
+        server.shutdown()
+    assert server.state["requests"] == 3
+
+
+def test_pooled_warm_fetches_every_country_over_few_connections(fixtures, cache_path):
+    server, url = serve_fixtures(fixtures, latency=0.05)
+    try:
+        client = UniversityClient(url, cache=ResponseCache(cache_path), pool_size=2)
+        counts = client.warm(list(fixtures))
+        assert counts == {country: len(records) for country, records in fixtures.items()}
+        # Eight concurrent readers of one uncached country share a single request
+        threads = [threading.Thread(target=client.universities, args=("Atlantis",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.shutdown()
+    assert server.state["requests"] == len(fixtures) + 1
+    assert len(server.state["connections"]) <= 2
+
+
+def test_restart_is_served_from_disk_cache(fixtures, cache_path):
+    server, url = serve_fixtures(fixtures)
+    try:
+        UniversityClient(url, cache=ResponseCache(cache_path)).warm(list(fixtures))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # A new process: fresh client and cache connection, and nothing listening at the URL
+    restarted = UniversityClient(url, cache=ResponseCache(cache_path), retries=0)
+    for country, records in fixtures.items():
+        assert restarted.universities(country) == records
+    assert server.state["requests"] == len(fixtures)
+
+
+def test_memory_expires_with_the_ttl(fixtures, cache_path):
+    server, url = serve_fixtures(fixtures)
+    try:
+        client = UniversityClient(url, cache=ResponseCache(cache_path, ttl=-1))
+        client.universities("Malta")
+        client.universities("Malta")
+    finally:
+        server.shutdown()
+    assert server.state["requests"] == 2
@@ -1,17 +1,37 @@
+import os
+import threading
 import streamlit as st
 import requests
+from uni_client import API_URL, CACHE_TTL, UniversityClient
+from uni_search import UniversityIndex
 
-@st.cache_data
-def fetch_universities(country):
-    """Fetch universities from API and cache results"""
-    url = f"http://universities.hipolabs.com/search?country={country}"
-    response = requests.get(url)
-    return response.json()
+COUNTRIES = ["Canada", "United Kingdom", "Australia", "Germany"]
+
+@st.cache_resource
+def get_client():
+    """One pooled API client per process (set UNIVERSITIES_API to point at a stand-in server)"""
+    return UniversityClient(os.environ.get("UNIVERSITIES_API", API_URL))
 
 @st.cache_resource
-def get_api_base_url():
-    """Cache the API base configuration"""
-    return "http://universities.hipolabs.com/search"
+def warm_up():
+    """Prefetch every selectable country in the background, once per process"""
+    thread = threading.Thread(target=get_client().warm, args=(COUNTRIES,), daemon=True)
+    thread.start()
+    return thread
+
+def fetch_universities(country):
+    """Fetch universities through the shared client (memory, then disk, then API)"""
+    return get_client().universities(country)
+
+@st.cache_resource(max_entries=len(COUNTRIES), ttl=CACHE_TTL)
+def load_index(country):
+    """Search index over one country's universities, rebuilt at most once per cache TTL"""
+    return UniversityIndex(fetch_universities(country))
+
+def first_page():
+    st.session_state.page = 1
+
+warm_up()
 
 st.title("University Finder")
 st.write("Search for universities by country (results are cached for faster loading)")
@@ -19,22 +39,37 @@ st.write("Search for universities by country (results are cached for faster load
 # Country selection
 country = st.selectbox(
     "Select a country:",
-    ["Canada", "United Kingdom", "Australia", "Germany"]
+    COUNTRIES,
+    on_change=first_page
 )
 
 if country:
     # Show loading message
     with st.spinner(f"Searching universities in {country}..."):
-        universities = fetch_universities(country)
-    
+        try:
+            index = load_index(country)
+        except requests.RequestException as exc:
+            st.error(f"Could not reach the universities API: {exc}")
+            st.stop()
+
     st.subheader(f"Universities in {country}")
-    st.write(f"Found {len(universities)} universities")
-    
-    # Display first 10 universities
-    for uni in universities[:10]:
+    query = st.text_input("Search by name, domain or state", placeholder="e.g. tech, ox, ontario",
+                          on_change=first_page)
+    hits = index.search(query)
+    page_size = 10
+    pages = max((len(hits) + page_size - 1) // page_size, 1)
+    page = st.number_input("Page", 1, pages, key="page") if pages > 1 else 1
+    start = (page - 1) * page_size
+    st.write(f"Found {len(hits)} of {len(index)} universities"
+             + (f" · showing {start + 1}–{min(start + page_size, len(hits))}" if len(hits) else ""))
+
+    # Only the current page is rendered
+    for uni in index.page(hits, page, page_size):
         with st.expander(uni['name']):
-            st.write(f"**Website:** {uni.get('web_pages', ['N/A'])[0]}")
-            st.write(f"**Domain:** {uni.get('domains', ['N/A'])[0]}")
-            
+            st.write(f"**Website:** {(uni.get('web_pages') or ['N/A'])[0]}")
+            st.write(f"**Domain:** {(uni.get('domains') or ['N/A'])[0]}")
+            if uni.get('state-province'):
+                st.write(f"**State:** {uni['state-province']}")
+
     # Show caching info
-    st.info("💡 Try selecting the same country again - it loads instantly from cache!")
\ No newline at end of file
+    st.info("💡 Try selecting the same country again - it loads instantly from cache!")
@@ -0,0 +1,201 @@
+import json
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_URL = "http://universities.hipolabs.com/search"
+CACHE_TTL = 24 * 3600
+
+
+class ResponseCache:
+    """JSON responses on disk with a time-to-live, shared by every session in the process"""
+
+    def __init__(self, path="universities_cache.db", ttl=CACHE_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, fetched REAL, body TEXT) WITHOUT ROWID"
+        )
+
+    def entry(self, key):
+        """(fetch time, value) for the key, or None when missing or older than the TTL"""
+        with self.lock:
+            row = self.conn.execute("SELECT fetched, body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, key, value):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (key, time.time(), json.dumps(value)))
+
+
+class UniversityClient:
+    """Universities API client with a pooled session, retries and a persistent TTL cache
+
+    One requests.Session keeps connections to the API open between calls;
+    failed requests are retried with exponential backoff. Results are kept
+    in memory and on disk under the same TTL, so a restart does not
+    refetch anything younger than it and a long-running process still
+    refreshes anything older. Concurrent requests for the same country
+    share one fetch.
+    """
+
+    def __init__(self, base_url=API_URL, cache=None, timeout=(3.05, 15), retries=3, backoff=0.5, pool_size=8):
+        self.base_url = base_url
+        self.cache = cache if cache is not None else ResponseCache()
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET"])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.pool_size = pool_size
+        self.memory = {}
+        self.locks = {}
+        self.lock = threading.Lock()
+
+    def _key_lock(self, country):
+        with self.lock:
+            return self.locks.setdefault(country, threading.Lock())
+
+    def _fresh(self, country):
+        entry = self.memory.get(country)
+        if entry is not None and time.time() - entry[0] <= self.cache.ttl:
+            return entry[1]
+        return None
+
+    def universities(self, country):
+        """All universities for a country, from memory, disk or the API in that order"""
+        data = self._fresh(country)
+        if data is not None:
+            return data
+        with self._key_lock(country):
+            data = self._fresh(country)  # fetched by another thread while we waited
+            if data is not None:
+                return data
+            # Kept in memory with the disk entry's own fetch time, so it expires when that does
+            entry = self.cache.entry(country)
+            if entry is None:
+                response = self.session.get(self.base_url, params={"country": country}, timeout=self.timeout)
+                response.raise_for_status()
+                entry = (time.time(), response.json())
+                self.cache.put(country, entry[1])
+            self.memory[country] = entry
+            return entry[1]
+
+    def warm(self, countries):
+        """Prefetch several countries concurrently; returns country -> count or the error raised"""
+
+        def fetch(country):
+            try:
+                return len(self.universities(country))
+            except requests.RequestException as exc:
+                return exc
+
+        with ThreadPoolExecutor(min(self.pool_size, len(countries) or 1)) as executor:
+            return dict(zip(countries, executor.map(fetch, countries)))
+
+
+def serve_fixtures(fixtures, latency=0.0, fail_first=0):
+    """Stand-in for the universities API on a free local port
+
+    Serves `fixtures` (country -> list of records) with an optional delay
+    per request, and answers the first `fail_first` requests with a 503 to
+    exercise retries. Returns the server (call shutdown() when done) and
+    its search URL; server.state counts requests and the client
+    connections they arrived on.
+    """
+    state = {"failures": fail_first, "requests": 0, "connections": set()}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so pooling is measurable
+
+        def do_GET(self):
+            with lock:
+                state["requests"] += 1
+                state["connections"].add(self.client_address)
+                fail = state["failures"] > 0
+                state["failures"] -= fail
+            time.sleep(latency)
+            if fail:
+                status, body = 503, b"{}"
+            else:
+                country = parse_qs(urlparse(self.path).query).get("country", [""])[0]
+                status, body = 200, json.dumps(fixtures.get(country, [])).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.state = state
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/search"
+
+
+def sample_fixtures(countries, per_country=500):
+    """Records shaped like the API's, for the stand-in server"""
+    return {
+        country: [
+            {"name": f"University {i} of {country}", "country": country, "state-province": None,
+             "domains": [f"u{i}.{country[:2].lower()}.edu"], "web_pages": [f"http://u{i}.{country[:2].lower()}.edu/"],
+             "alpha_two_code": country[:2].upper()}
+            for i in range(per_country)
+        ]
+        for country in countries
+    }
+
+
+def benchmark(countries=("Canada", "United Kingdom", "Australia", "Germany"), latency=0.2):
+    """Bare requests.get vs the pooled client against a local server with simulated latency"""
+    import os
+    import tempfile
+
+    server, url = serve_fixtures(sample_fixtures(countries), latency=latency, fail_first=1)
+    path = os.path.join(tempfile.mkdtemp(), "cache.db")
+    try:
+        start = time.perf_counter()
+        for country in countries:
+            try:
+                requests.get(url, params={"country": country}, timeout=5).json()
+            except ValueError:
+                pass  # the injected 503 is not retried here
+        bare = time.perf_counter() - start
+
+        client = UniversityClient(url, cache=ResponseCache(path))
+        start = time.perf_counter()
+        counts = client.warm(list(countries))
+        warm = time.perf_counter() - start
+
+        restarted = UniversityClient(url, cache=ResponseCache(path))
+        start = time.perf_counter()
+        restarted.warm(list(countries))
+        cached = time.perf_counter() - start
+    finally:
+        server.shutdown()
+    print(f"{len(countries)} countries, {latency * 1000:.0f} ms per request, first request fails with 503")
+    print(f"sequential requests.get:      {bare:.3f}s")
+    print(f"pooled concurrent warm-up:    {warm:.3f}s  {counts}")
+    print(f"after restart (disk cache):   {cached:.3f}s")
+    print(f"requests served: {server.state['requests']}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,108 @@
+import re
+import time
+from bisect import bisect_left
+
+import numpy as np
+
+TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokens(text):
+    return TOKEN.findall(text.lower()) if text else []
+
+
+class UniversityIndex:
+    """Prefix and token search over university name, domain and state
+
+    Every distinct token maps to a sorted posting list of record positions,
+    and the token vocabulary is kept sorted, so a prefix is one binary
+    search to a contiguous range of tokens. A query's words must all match
+    (as a word or the start of one); hits come back in name order, with
+    names starting with the query first.
+    """
+
+    def __init__(self, records):
+        self.records = list(records)
+        self.names = [r.get("name") or "" for r in self.records]
+        postings = {}
+        for i, r in enumerate(self.records):
+            words = tokens(self.names[i]) + tokens(r.get("state-province"))
+            for domain in r.get("domains") or []:
+                words += tokens(domain)
+            for word in set(words):
+                postings.setdefault(word, []).append(i)
+        self.vocab = sorted(postings)
+        self.postings = [np.array(postings[word], dtype=np.int32) for word in self.vocab]
+        # Rank of each record in case-insensitive name order
+        order = sorted(range(len(self.names)), key=lambda i: self.names[i].lower())
+        self.rank = np.empty(len(order), dtype=np.int32)
+        self.rank[order] = np.arange(len(order), dtype=np.int32)
+        self.by_name = np.array(order, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.records)
+
+    def _prefix(self, word):
+        lo = bisect_left(self.vocab, word)
+        hi = bisect_left(self.vocab, word + "\uffff", lo)
+        if hi - lo == 1:
+            return self.postings[lo]
+        if hi == lo:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate(self.postings[lo:hi]))
+
+    def search(self, query):
+        """Record positions matching every word of the query, best first"""
+        words = tokens(query)
+        if not words:
+            return self.by_name
+        hits = None
+        for word in sorted(set(words), key=len, reverse=True):  # longer prefixes are more selective
+            found = self._prefix(word)
+            hits = found if hits is None else np.intersect1d(hits, found, assume_unique=True)
+            if not len(hits):
+                return hits
+        hits = hits[np.argsort(self.rank[hits], kind="stable")]
+        needle = query.strip().lower()
+        starts = np.fromiter((self.names[i].lower().startswith(needle) for i in hits), dtype=bool, count=len(hits))
+        return np.concatenate((hits[starts], hits[~starts]))
+
+    def page(self, hits, page, page_size=10):
+        """The records on a 1-based page of hits"""
+        start = (page - 1) * page_size
+        return [self.records[i] for i in hits[start:start + page_size]]
+
+
+def synthetic_records(count, seed=0):
+    rng = np.random.default_rng(seed)
+    first = ["North", "South", "Central", "Western", "Eastern", "Saint", "Lake", "Mount", "Pacific", "Atlantic"]
+    second = ["Valley", "State", "Technical", "Community", "Baptist", "Methodist", "Medical", "Polytechnic"]
+    states = ["California", "Texas", "New York", "Ohio", "Florida", "Oregon", "Maine", None]
+    records = []
+    for i in range(count):
+        name = f"{first[rng.integers(len(first))]} {second[rng.integers(len(second))]} University {i}"
+        slug = name.lower().replace(" ", "")[:12]
+        records.append({"name": name, "state-province": states[rng.integers(len(states))],
+                        "domains": [f"{slug}{i}.edu"], "web_pages": [f"http://{slug}{i}.edu/"]})
+    return records
+
+
+def benchmark(count=10_000, query="north state university 12"):
+    """Build time and per-keystroke latency while typing a query"""
+    records = synthetic_records(count)
+    start = time.perf_counter()
+    index = UniversityIndex(records)
+    print(f"{count:,} records, index built in {(time.perf_counter() - start) * 1000:.0f} ms")
+    worst = 0.0
+    for end in range(1, len(query) + 1):
+        start = time.perf_counter()
+        hits = index.search(query[:end])
+        index.page(hits, 1)
+        elapsed = (time.perf_counter() - start) * 1000
+        worst = max(worst, elapsed)
+        print(f"{query[:end]!r:<28} {len(hits):>6} hits {elapsed:>7.2f} ms")
+    print(f"worst keystroke: {worst:.2f} ms")
+
+
+if __name__ == "__main__":
+    benchmark()